@@ -9,11 +9,17 @@ import pygetwindow as gw
 import requests
 import json
 import threading
+from collections import deque
 from datetime import datetime, timezone
 from queue import Queue
 from typing import Optional, Dict, List
 import logging
 
+try:
+    import win32gui
+except ImportError:
+    win32gui = None
+
 # Configure
 pyautogui.FAILSAFE = True
 pyautogui.PAUSE = 0.3
@@ -24,6 +30,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Top-level window classes that are never Claude Desktop (Firefox, UWP/Edge).
+# Chromium browsers share "Chrome_WidgetWin_1" with Electron apps such as
+# Claude Desktop, so those are still filtered by title.
+BROWSER_CLASSES = frozenset({"MozillaWindowClass", "ApplicationFrameWindow"})
+
+
+def is_desktop_claude_window(window) -> bool:
+    """Return True if window looks like Claude Desktop rather than a browser tab"""
+    hwnd = getattr(window, "_hWnd", None)
+    if win32gui is not None and hwnd:
+        if win32gui.GetClassName(hwnd) in BROWSER_CLASSES:
+            return False
+
+    title = window.title.lower()
+    return "claude.ai" not in title and "chrome" not in title
+
 
 class DesktopClaudeClient:
     """
@@ -46,6 +68,10 @@ class DesktopClaudeClient:
         self.command_queue = Queue()
         self.running = False
         self.last_heartbeat = time.time()
+        # Messages longer than this (or containing non-ASCII) are pasted via
+        # the clipboard; pasting has a ~100ms fixed cost, so short ASCII text
+        # is faster to type.
+        self.paste_threshold = 200
 
     def find_window(self) -> bool:
         """
@@ -63,10 +89,7 @@ class DesktopClaudeClient:
                 if windows:
                     # Filter out browser Claude (contains 'claude.ai')
                     desktop_windows = [
-                        w
-                        for w in windows
-                        if "claude.ai" not in w.title.lower()
-                        and "chrome" not in w.title.lower()
+                        w for w in windows if is_desktop_claude_window(w)
                     ]
 
                     if desktop_windows:
@@ -165,13 +188,15 @@ class DesktopClaudeClient:
             pyautogui.press("delete")
             time.sleep(0.2)
 
-            # Type message (handle special characters)
-            # Split into chunks to avoid issues with long text
-            chunk_size = 500
-            for i in range(0, len(text), chunk_size):
-                chunk = text[i : i + chunk_size]
-                pyautogui.write(chunk, interval=0.01)
-                time.sleep(0.1)
+            # pyautogui.write silently drops non-ASCII characters, so paste
+            # Unicode (and long) text through the clipboard instead
+            if len(text) > self.paste_threshold or not text.isascii():
+                import pyperclip
+
+                pyperclip.copy(text)
+                pyautogui.hotkey("ctrl", "v")
+            else:
+                pyautogui.write(text, interval=0)
 
             time.sleep(0.3)
 
@@ -265,10 +290,11 @@ class DesktopClaudeClient:
                 lines = clipboard_text.split("\n")
 
                 # Find last substantial block of text
-                response_lines = []
+                # (deque.appendleft is O(1), list.insert(0) is O(n))
+                response_lines = deque()
                 for line in reversed(lines):
                     if line.strip():
-                        response_lines.insert(0, line)
+                        response_lines.appendleft(line)
                     elif response_lines:
                         # Hit empty line after finding text - stop
                         break
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Async Diagnostic Agent Client - Run all agent channels from ONE process
+
+Instead of launching one blocking diagnostic_agent_client.py per role, this
+client polls every agent channel concurrently over a single aiohttp session
+(one connection pool, one event loop).
+
+Usage:
+    python diagnostic_agent_async.py                  # all 5 roles
+    python diagnostic_agent_async.py 1 3              # only roles 1 and 3
+"""
+
+import asyncio
+import sys
+
+try:
+    import aiohttp
+except ImportError:
+    print("aiohttp not installed. Install with: pip install aiohttp", file=sys.stderr)
+    sys.exit(1)
+
+from diagnostic_agent_client import AVAILABLE_ROLES, BASE_URL
+
+POLL_INTERVAL = 3  # seconds between polls per channel
+REQUEST_TIMEOUT = 30  # seconds per poll request
+
+
+async def poll_task(session, channel):
+    """Poll a single channel until a task arrives"""
+    while True:
+        try:
+            async with session.get(
+                f"{BASE_URL}/messages", params={"channel": channel}
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    messages = data.get("messages", [])
+                    if messages:
+                        return messages[0]["content"]
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"⚠️  [{channel}] Poll error: {e}")
+
+        await asyncio.sleep(POLL_INTERVAL)
+
+
+async def run_agent(session, channel):
+    """Wait for this channel's task and print it"""
+    print(f"📬 Polling for task on channel: {channel}")
+    task = await poll_task(session, channel)
+
+    print("\n" + "=" * 60)
+    print(f"📋 TASK RECEIVED [{channel}]:")
+    print("=" * 60)
+    print(task)
+    print("=" * 60)
+    return channel, task
+
+
+async def run_agents(channels):
+    """Poll all channels concurrently over one shared session"""
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        results = await asyncio.gather(*(run_agent(session, c) for c in channels))
+    return dict(results)
+
+
+def main():
+    """Main entry point"""
+    choices = sys.argv[1:] or list(AVAILABLE_ROLES)
+    invalid = [c for c in choices if c not in AVAILABLE_ROLES]
+    if invalid:
+        print(f"❌ Invalid role(s): {', '.join(invalid)}")
+        sys.exit(1)
+
+    channels = [AVAILABLE_ROLES[c] for c in choices]
+
+    print("🎭 ASYNC DIAGNOSTIC AGENT CLIENT")
+    print("=" * 60)
+    print(f"🌉 Bridge: {BASE_URL}")
+    print(f"📡 Channels: {', '.join(channels)}")
+    print("⏳ Waiting for orchestrator...")
+
+    tasks = asyncio.run(run_agents(channels))
+
+    print(f"\n✅ Received {len(tasks)} task(s)")
+    print("   Send results with diagnostic_agent_client.send_result(channel, result)")
+
+
+if __name__ == "__main__":
+    main()
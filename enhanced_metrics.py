@@ -3,11 +3,22 @@
 Enhanced Metrics and Analytics
 Detailed performance metrics, histograms, percentiles, time-series data
 """
+import marshal
 import time
-from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional
-from collections import defaultdict, deque
-import statistics
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+from collections import deque
+from itertools import islice
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 
 class Histogram:
@@ -20,6 +31,8 @@ class Histogram:
         hist.observe(250)  # Falls in 100-500 bucket
     """
 
+    __slots__ = ("buckets", "counts", "_bounds", "sum", "count", "_buckets_np")
+
     def __init__(self, buckets: List[float]):
         """
         Initialize histogram
@@ -28,23 +41,50 @@ class Histogram:
             buckets: Bucket boundaries (e.g., [10, 50, 100, 500])
         """
         self.buckets = sorted(buckets)
-        self.counts = defaultdict(int)
+        # counts[i] is the number of observations in buckets[i]; the final
+        # slot counts observations above the largest bucket (+Inf)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self._bounds = (*self.buckets, float("inf"))  # Labels for self.counts
         self.sum = 0
         self.count = 0
+        self._buckets_np = (
+            np.asarray(self.buckets, dtype=np.float64) if NUMPY_AVAILABLE else None
+        )
 
     def observe(self, value: float):
         """Add observation to histogram"""
         self.sum += value
         self.count += 1
 
-        # Find bucket
-        for bucket in self.buckets:
-            if value <= bucket:
-                self.counts[bucket] += 1
-                return
+        # First bucket with value <= bucket. The C bisect beats a Python
+        # linear scan even for 1-4 buckets, so there is no small-size path.
+        self.counts[bisect_left(self.buckets, value)] += 1
+
+    def observe_many(self, values):
+        """
+        Add a batch of observations
+
+        Uses numpy (searchsorted + bincount) when available, otherwise
+        falls back to observe() per value.
+        """
+        if not NUMPY_AVAILABLE:
+            for value in values:
+                self.observe(value)
+            return
+
+        arr = np.asarray(values, dtype=np.float64).ravel()
+        if arr.size == 0:
+            return
+
+        # searchsorted outperforms a broadcast compare-and-count
+        # ((arr[:, None] > buckets).sum(axis=1)) even for 4 buckets
+        indices = np.searchsorted(self._buckets_np, arr, side="left")
+        batch_counts = np.bincount(indices, minlength=len(self.counts))
+        for i, n in enumerate(batch_counts.tolist()):
+            self.counts[i] += n
 
-        # Value exceeds all buckets
-        self.counts[float("inf")] += 1
+        self.sum += arr.sum().item()
+        self.count += arr.size
 
     def get_stats(self) -> Dict:
         """Get histogram statistics"""
@@ -55,46 +95,133 @@ class Histogram:
             "count": self.count,
             "sum": self.sum,
             "avg": self.sum / self.count,
-            "buckets": dict(self.counts),
+            "buckets": {
+                bucket: count
+                for bucket, count in zip(self._bounds, self.counts)
+                if count
+            },
         }
 
 
-class Counter:
-    """Thread-safe counter with labels"""
+class LabeledMetric:
+    """Base for metrics that store one value per label set"""
+
+    __slots__ = ("name", "help_text", "values", "_key_cache")
 
     def __init__(self, name: str, help_text: str = ""):
         self.name = name
         self.help_text = help_text
-        self.values = defaultdict(int)
+        self.values = {}
+        self._key_cache = {}  # frozenset of (label, value, type) -> key
+
+    def _labels_to_key(self, labels: Optional[Dict]) -> str:
+        """Convert labels dict to string key"""
+        if not labels:
+            return ""
+        if len(labels) == 1:  # Common shape; formatting beats the cache lookup
+            ((k, v),) = labels.items()
+            return f"{k}={v}"
+
+        try:
+            # type(v) keeps equal-but-distinct values (1, 1.0, True) apart
+            cache_key = frozenset((k, v, type(v)) for k, v in labels.items())
+        except TypeError:  # Unhashable label value
+            return ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+
+        key = self._key_cache.get(cache_key)
+        if key is None:
+            key = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+            self._key_cache[cache_key] = key
+        return key
+
+    def _live_values(self) -> Dict:
+        """Current values without copying (callers must not mutate)"""
+        return self.values
+
+    def get_all(self) -> Dict:
+        """Get all values keyed by label string"""
+        return dict(self._live_values())
+
+
+class Counter(LabeledMetric):
+    """Thread-safe counter with labels"""
+
+    __slots__ = ("_nolabel_value",)
+
+    def __init__(self, name: str, help_text: str = ""):
+        super().__init__(name, help_text)
+        # Unlabeled count lives in an attribute (about 2x faster to bump
+        # than a dict slot) and is copied into values[""] on read
+        self._nolabel_value = 0
 
     def inc(self, labels: Optional[Dict] = None, amount: int = 1):
         """Increment counter"""
+        if not labels:
+            self._nolabel_value += amount
+            return
+
+        key = self._labels_to_key(labels)
+        try:
+            self.values[key] += amount
+        except KeyError:
+            self.values[key] = amount
+
+    def inc_key(self, key: str, amount: int = 1):
+        """Increment counter by precomputed label key (as in get_all())"""
+        if not key:
+            self._nolabel_value += amount
+            return
+
+        try:
+            self.values[key] += amount
+        except KeyError:
+            self.values[key] = amount
+
+    def bind(self, labels: Optional[Dict] = None) -> Callable[..., None]:
+        """
+        Get an increment function for one label set
+
+        Serializes the labels once; calling the result as fn(amount=1)
+        skips label handling entirely.
+        """
+        if not labels:
+            return self._inc_unlabeled
+
         key = self._labels_to_key(labels)
-        self.values[key] += amount
+        values = self.values
+
+        def inc(amount: int = 1):
+            try:
+                values[key] += amount
+            except KeyError:
+                values[key] = amount
+
+        return inc
+
+    def _inc_unlabeled(self, amount: int = 1):
+        self._nolabel_value += amount
 
     def get(self, labels: Optional[Dict] = None) -> int:
         """Get counter value"""
+        if not labels:
+            return self._nolabel_value
         key = self._labels_to_key(labels)
         return self.values.get(key, 0)
 
-    def _labels_to_key(self, labels: Optional[Dict]) -> str:
-        """Convert labels dict to string key"""
-        if not labels:
-            return ""
-        return ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-
-    def get_all(self) -> Dict:
-        """Get all counter values"""
-        return dict(self.values)
+    def _live_values(self) -> Dict:
+        """Current values without copying (callers must not mutate)"""
+        if self._nolabel_value or "" in self.values:
+            self.values[""] = self._nolabel_value
+        return self.values
 
 
-class Gauge:
+class Gauge(LabeledMetric):
     """Gauge metric (can go up or down)"""
 
+    __slots__ = ()
+
     def __init__(self, name: str, help_text: str = ""):
-        self.name = name
-        self.help_text = help_text
-        self.values = defaultdict(float)
+        super().__init__(name, help_text)
 
     def set(self, value: float, labels: Optional[Dict] = None):
         """Set gauge value"""
@@ -116,16 +243,6 @@ class Gauge:
         key = self._labels_to_key(labels)
         return self.values.get(key, 0)
 
-    def _labels_to_key(self, labels: Optional[Dict]) -> str:
-        """Convert labels dict to string key"""
-        if not labels:
-            return ""
-        return ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-
-    def get_all(self) -> Dict:
-        """Get all gauge values"""
-        return dict(self.values)
-
 
 class Summary:
     """
@@ -134,30 +251,68 @@ class Summary:
     Tracks count, sum, and calculates percentiles
     """
 
+    __slots__ = (
+        "name",
+        "help_text",
+        "max_age",
+        "_timestamps",
+        "_values",
+        "_head",
+        "_window_sum",
+        "count",
+        "sum",
+        "_obs_since_cleanup",
+    )
+
+    CLEANUP_INTERVAL = 64  # Observations between expiry sweeps
+    NUMPY_MIN_SIZE = 256  # Below this, sorted() beats numpy's call overhead
+
     def __init__(self, name: str, help_text: str = "", max_age: int = 600):
         self.name = name
         self.help_text = help_text
         self.max_age = max_age  # Keep observations for N seconds
-        self.observations = deque()  # (timestamp, value)
+        # Observations as parallel float arrays; entries before _head have
+        # expired and are compacted away once they make up half the buffer
+        self._timestamps = array("d")
+        self._values = array("d")
+        self._head = 0
+        self._window_sum = 0.0  # Sum of live (unexpired) observations
         self.count = 0
         self.sum = 0
+        self._obs_since_cleanup = 0
 
     def observe(self, value: float):
         """Add observation"""
         now = time.time()
-        self.observations.append((now, value))
+        self._timestamps.append(now)
+        self._values.append(value)
+        self._window_sum += value
         self.count += 1
         self.sum += value
 
-        # Clean old observations
-        self._cleanup_old()
+        # Clean old observations every CLEANUP_INTERVAL observes
+        self._obs_since_cleanup += 1
+        if self._obs_since_cleanup >= self.CLEANUP_INTERVAL:
+            self._cleanup_old(now)
 
-    def _cleanup_old(self):
+    def _cleanup_old(self, now: Optional[float] = None):
         """Remove observations older than max_age"""
-        cutoff = time.time() - self.max_age
-
-        while self.observations and self.observations[0][0] < cutoff:
-            self.observations.popleft()
+        if now is None:
+            now = time.time()
+        cutoff = now - self.max_age
+        self._obs_since_cleanup = 0
+
+        head = bisect_left(self._timestamps, cutoff, self._head)
+        if head == len(self._values):
+            self._window_sum = 0.0  # Reset so float error can't accumulate
+        elif head > self._head:
+            self._window_sum -= sum(self._values[self._head : head])
+
+        if head * 2 > len(self._timestamps):
+            del self._timestamps[:head]
+            del self._values[:head]
+            head = 0
+        self._head = head
 
     def get_stats(self, quantiles: List[float] = [0.5, 0.9, 0.95, 0.99]) -> Dict:
         """
@@ -176,29 +331,67 @@ class Summary:
         """
         self._cleanup_old()
 
-        if not self.observations:
+        head = self._head
+        n = len(self._values) - head
+        if not n:
             return {"count": 0, "sum": 0, "avg": 0, "quantiles": {}}
 
-        values = [v for _, v in self.observations]
-        sorted_values = sorted(values)
-
-        quantile_results = {}
-        for q in quantiles:
-            idx = int(len(sorted_values) * q)
-            if idx >= len(sorted_values):
-                idx = len(sorted_values) - 1
-            quantile_results[q] = sorted_values[idx]
+        positions = {q: min(int(n * q), n - 1) for q in quantiles}
+
+        if NUMPY_AVAILABLE and n >= self.NUMPY_MIN_SIZE:
+            # Select only the needed order statistics instead of sorting
+            # (plus min/max, which come out of the same selection). The
+            # window is sliced from a frombuffer view, so the only copy is
+            # partition's own, and the view is gone before anyone appends
+            kth = sorted({0, n - 1, *positions.values()})
+            selected = np.partition(
+                np.frombuffer(self._values, dtype=np.float64)[head:], kth
+            )
+            quantile_results = {q: selected[i].item() for q, i in positions.items()}
+            low, high = selected[0].item(), selected[-1].item()
+        else:
+            sorted_values = sorted(self._values[head:])
+            quantile_results = {q: sorted_values[i] for q, i in positions.items()}
+            low, high = sorted_values[0], sorted_values[-1]
 
         return {
-            "count": len(values),
-            "sum": sum(values),
-            "avg": statistics.mean(values),
-            "min": min(values),
-            "max": max(values),
+            "count": n,
+            "sum": self._window_sum,
+            "avg": self._window_sum / n,
+            "min": low,
+            "max": high,
             "quantiles": quantile_results,
         }
 
 
+class PromTemplate:
+    """Precomputed (UTF-8 encoded) Prometheus text fragments for one metric"""
+
+    def __init__(self, name: str, metric_type: str, help_text: str):
+        self.name = name
+        self.header = (
+            f"# HELP {name} {help_text}\n# TYPE {name} {metric_type}\n".encode()
+        )
+        self.sum_prefix = f"{name}_sum ".encode()
+        self.count_prefix = f"{name}_count ".encode()
+        self.bucket_prefixes = []  # Histograms only, aligned with counts
+        self._prefixes = {}  # labels key -> b"name{labels} "
+        # Last rendered section and the metric state it was rendered from
+        self.cached_state = None
+        self.cached_section = b""
+
+    def prefix(self, labels_key: str) -> bytes:
+        """Get (and cache) the line prefix for a labels key"""
+        prefix = self._prefixes.get(labels_key)
+        if prefix is None:
+            if labels_key:
+                prefix = f"{self.name}{{{labels_key}}} ".encode()
+            else:
+                prefix = f"{self.name} ".encode()
+            self._prefixes[labels_key] = prefix
+        return prefix
+
+
 class MetricsCollector:
     """
     Central metrics collector
@@ -210,23 +403,42 @@ class MetricsCollector:
     - Time-series snapshots
     """
 
-    def __init__(self):
+    _EMPTY_SNAPSHOT = {"counters": {}, "gauges": {}, "histograms": {}, "summaries": {}}
+
+    def __init__(self, compact_snapshots: bool = False):
+        """
+        Initialize collector
+
+        Args:
+            compact_snapshots: Store retained snapshots as marshal-encoded
+                bytes (~10x smaller than dicts); get_time_series decodes
+                only the snapshots inside the requested window
+        """
+        self.compact_snapshots = compact_snapshots
         self.counters: Dict[str, Counter] = {}
         self.gauges: Dict[str, Gauge] = {}
         self.histograms: Dict[str, Histogram] = {}
         self.summaries: Dict[str, Summary] = {}
         self.snapshots = deque(maxlen=1000)  # Keep last 1000 snapshots
+        self._snapshot_epochs = deque(maxlen=1000)  # Parallel to snapshots
+        self._prom_templates: Dict[tuple, PromTemplate] = {}  # (type, name)
+        self._scratch_section: Dict = {}  # Reused by take_snapshot
+        self._last_snapshot: Optional[Dict] = None
 
     def counter(self, name: str, help_text: str = "") -> Counter:
         """Get or create counter"""
         if name not in self.counters:
             self.counters[name] = Counter(name, help_text)
+            self._prom_templates["counter", name] = PromTemplate(
+                name, "counter", help_text
+            )
         return self.counters[name]
 
     def gauge(self, name: str, help_text: str = "") -> Gauge:
         """Get or create gauge"""
         if name not in self.gauges:
             self.gauges[name] = Gauge(name, help_text)
+            self._prom_templates["gauge", name] = PromTemplate(name, "gauge", help_text)
         return self.gauges[name]
 
     def histogram(
@@ -234,38 +446,85 @@ class MetricsCollector:
     ) -> Histogram:
         """Get or create histogram"""
         if name not in self.histograms:
-            self.histograms[name] = Histogram(buckets)
+            histogram = Histogram(buckets)
+            template = PromTemplate(name, "histogram", "Histogram")
+            for bucket in histogram._bounds:
+                bucket_label = "+In" if bucket == float("inf") else str(bucket)
+                template.bucket_prefixes.append(
+                    f'{name}_bucket{{le="{bucket_label}"}} '.encode()
+                )
+
+            self.histograms[name] = histogram
+            self._prom_templates["histogram", name] = template
         return self.histograms[name]
 
     def summary(self, name: str, help_text: str = "", max_age: int = 600) -> Summary:
         """Get or create summary"""
         if name not in self.summaries:
             self.summaries[name] = Summary(name, help_text, max_age)
+            self._prom_templates["summary", name] = PromTemplate(
+                name, "summary", "Summary"
+            )
         return self.summaries[name]
 
-    def take_snapshot(self):
-        """Take snapshot of all metrics"""
-        snapshot = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "counters": {},
-            "gauges": {},
-            "histograms": {},
-            "summaries": {},
-        }
-
-        for name, counter in self.counters.items():
-            snapshot["counters"][name] = counter.get_all()
+    @staticmethod
+    def _snapshot_value(metric, prev: Optional[Dict]) -> Dict:
+        """Get snapshot data for a metric, reusing prev if it is unchanged"""
+        if isinstance(metric, LabeledMetric):
+            if prev is not None and prev == metric._live_values():
+                return prev
+            return metric.get_all()
 
-        for name, gauge in self.gauges.items():
-            snapshot["gauges"][name] = gauge.get_all()
+        if isinstance(metric, Histogram):
+            if prev is not None and prev["count"] == metric.count:
+                return prev
+            return metric.get_stats()
 
-        for name, histogram in self.histograms.items():
-            snapshot["histograms"][name] = histogram.get_stats()
+        # Summary windows age over time, so always recompute
+        return metric.get_stats()
 
-        for name, summary in self.summaries.items():
-            snapshot["summaries"][name] = summary.get_stats()
+    def take_snapshot(self):
+        """
+        Take snapshot of all metrics
 
-        self.snapshots.append(snapshot)
+        Metrics that have not changed since the previous snapshot share
+        that snapshot's data (whole sections, if nothing in them changed),
+        so retained snapshots only cost memory for what changed. Treat
+        snapshot contents as read-only.
+        """
+        now = time.time()
+        snapshot = {
+            "timestamp": datetime.fromtimestamp(now, timezone.utc).isoformat(),
+            "_epoch": now,
+        }
+        previous = self._last_snapshot or self._EMPTY_SNAPSHOT
+        scratch = self._scratch_section
+
+        for kind, metrics in (
+            ("counters", self.counters),
+            ("gauges", self.gauges),
+            ("histograms", self.histograms),
+            ("summaries", self.summaries),
+        ):
+            prev_section = previous[kind]
+            changed = len(metrics) != len(prev_section)
+
+            # Fill the reusable scratch dict; only copy it out if it differs
+            scratch.clear()
+            for name, metric in metrics.items():
+                prev = prev_section.get(name)
+                value = self._snapshot_value(metric, prev)
+                scratch[name] = value
+                changed = changed or value is not prev
+
+            snapshot[kind] = dict(scratch) if changed else prev_section
+
+        self._last_snapshot = snapshot
+        if self.compact_snapshots:
+            self.snapshots.append(marshal.dumps(snapshot))
+        else:
+            self.snapshots.append(snapshot)
+        self._snapshot_epochs.append(now)
 
         return snapshot
 
@@ -276,58 +535,75 @@ class MetricsCollector:
         Returns:
             Prometheus-formatted metrics text
         """
-        lines = []
-
-        # Counters
-        for name, counter in self.counters.items():
-            lines.append(f"# HELP {name} {counter.help_text}")
-            lines.append(f"# TYPE {name} counter")
-
-            for labels_key, value in counter.get_all().items():
-                if labels_key:
-                    lines.append(f"{name}{{{labels_key}}} {value}")
-                else:
-                    lines.append(f"{name} {value}")
-
-        # Gauges
-        for name, gauge in self.gauges.items():
-            lines.append(f"# HELP {name} {gauge.help_text}")
-            lines.append(f"# TYPE {name} gauge")
-
-            for labels_key, value in gauge.get_all().items():
-                if labels_key:
-                    lines.append(f"{name}{{{labels_key}}} {value}")
-                else:
-                    lines.append(f"{name} {value}")
-
-        # Histograms
+        return self.get_prometheus_bytes().decode().rstrip("\n")
+
+    def get_prometheus_bytes(self) -> bytes:
+        """
+        Export metrics in Prometheus format as an HTTP-ready byte string
+
+        Returns:
+            UTF-8 Prometheus exposition text, newline-terminated
+        """
+        buf = bytearray()
+        write = buf.extend
+        templates = self._prom_templates
+
+        # Counters, gauges and histograms are only re-rendered when their
+        # state differs from the last scrape; otherwise the cached bytes
+        # are reused (a C-level compare, nothing added to inc/observe)
+        for kind, metrics in (("counter", self.counters), ("gauge", self.gauges)):
+            for name, metric in metrics.items():
+                template = templates[kind, name]
+                values = metric._live_values()
+
+                if template.cached_state != values:
+                    section = bytearray(template.header)
+                    for labels_key, value in values.items():
+                        section += template.prefix(labels_key)
+                        section += b"%s\n" % str(value).encode()
+
+                    template.cached_state = dict(values)
+                    template.cached_section = bytes(section)
+
+                write(template.cached_section)
+
         for name, histogram in self.histograms.items():
-            lines.append(f"# HELP {name} Histogram")
-            lines.append(f"# TYPE {name} histogram")
+            template = templates["histogram", name]
 
-            stats = histogram.get_stats()
+            if template.cached_state != histogram.count:
+                section = bytearray(template.header)
+                for prefix, count in zip(template.bucket_prefixes, histogram.counts):
+                    if count:
+                        section += prefix
+                        section += b"%d\n" % count
 
-            for bucket, count in stats["buckets"].items():
-                bucket_label = "+In" if bucket == float("inf") else str(bucket)
-                lines.append(f'{name}_bucket{{le="{bucket_label}"}} {count}')
+                section += template.sum_prefix
+                section += b"%s\n" % str(histogram.sum).encode()
+                section += template.count_prefix
+                section += b"%d\n" % histogram.count
 
-            lines.append(f"{name}_sum {stats['sum']}")
-            lines.append(f"{name}_count {stats['count']}")
+                template.cached_state = histogram.count
+                template.cached_section = bytes(section)
 
-        # Summaries
+            write(template.cached_section)
+
+        # Summaries: windows age over time, so always render
         for name, summary in self.summaries.items():
-            lines.append(f"# HELP {name} Summary")
-            lines.append(f"# TYPE {name} summary")
+            template = templates["summary", name]
+            write(template.header)
 
             stats = summary.get_stats()
 
             for quantile, value in stats.get("quantiles", {}).items():
-                lines.append(f'{name}{{quantile="{quantile}"}} {value}')
+                write(template.prefix(f'quantile="{quantile}"'))
+                write(b"%s\n" % str(value).encode())
 
-            lines.append(f"{name}_sum {stats['sum']}")
-            lines.append(f"{name}_count {stats['count']}")
+            write(template.sum_prefix)
+            write(b"%s\n" % str(stats["sum"]).encode())
+            write(template.count_prefix)
+            write(b"%d\n" % stats["count"])
 
-        return "\n".join(lines)
+        return bytes(buf)
 
     def get_time_series(
         self, metric_name: str, metric_type: str, duration_minutes: int = 60
@@ -343,13 +619,17 @@ class MetricsCollector:
         Returns:
             List of {timestamp, value} dicts
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(minutes=duration_minutes)
+        cutoff = time.time() - duration_minutes * 60
         series = []
 
-        for snapshot in self.snapshots:
-            ts = datetime.fromisoformat(snapshot["timestamp"])
-            if ts < cutoff:
-                continue
+        # Snapshots are chronological: find the window start, then walk
+        # back from the newest end so older snapshots are never visited
+        start = bisect_left(self._snapshot_epochs, cutoff)
+        recent = islice(reversed(self.snapshots), len(self.snapshots) - start)
+
+        for snapshot in reversed(list(recent)):
+            if self.compact_snapshots:
+                snapshot = marshal.loads(snapshot)
 
             metric_data = snapshot.get(f"{metric_type}s", {}).get(metric_name)
             if metric_data:
@@ -7,29 +7,168 @@ Identified in collaborative brainstorming as improvement idea
 """
 import os
 import json
+import logging
+import time
+import shutil
+import functools
+import inspect
+import threading
 import subprocess
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+import requests
+from requests.adapters import HTTPAdapter
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = "https://api.github.com"
+MAX_CONCURRENCY = 5  # parallel GitHub calls per batch
+HTTP_POOL_SIZE = 20  # keep-alive connections kept to api.github.com
+HTTP_TIMEOUT = (10, 30)  # (connect, read) seconds
+
+# Read cache: seconds each read stays fresh, and total entries kept (LRU)
+CACHE_TTLS = {
+    "get_issue": 30,
+    "get_pr": 30,
+    "list_open_issues": 30,
+    "list_open_prs": 60,
+}
+CACHE_MAXSIZE = 1024
+
+# gh --json fields fetched by default; pass a subset as `fields` to fetch less
+ISSUE_FIELDS = ("number", "title", "body", "state", "labels", "assignees", "url")
+PR_FIELDS = ("number", "title", "body", "state", "headRefName", "baseRefName", "url")
+
+# gh command prefixes, shared by every call
+GH_ISSUE = ("gh", "issue")
+GH_PR = ("gh", "pr")
+
+
+@functools.lru_cache(maxsize=1)
+def _gh_executable() -> str:
+    """Absolute path to gh (falls back to "gh" so a missing CLI still raises)"""
+    return shutil.which("gh") or "gh"
+
+
+def _gh_run(cmd, timeout: float = 30) -> subprocess.CompletedProcess:
+    """
+    Run a trusted gh command and capture its output
+
+    Running an absolute path with close_fds=False lets CPython start gh via
+    posix_spawn/vfork instead of fork + closing every inherited descriptor,
+    which is slow under high fd limits. (Passing process_group would force
+    the fork path, so it is deliberately left unset.)
+    """
+    return subprocess.run(
+        [_gh_executable(), *cmd[1:]],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        close_fds=False,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _json_arg(fields: Tuple[str, ...]) -> str:
+    """gh --json argument for a field tuple (joined once per distinct tuple)"""
+    return ",".join(fields)
+
+
+def cached_read(func):
+    """Serve a read from GitHubIntegration's TTL/LRU cache when fresh"""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        # Key on every argument in signature order (defaults filled in), so
+        # get_issue(5) and get_issue(issue_number=5) share one entry with
+        # the number at key[1], where _invalidate looks for it
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (
+            func.__name__,
+            *(
+                tuple(v) if isinstance(v, list) else v
+                for v in islice(bound.arguments.values(), 1, None)
+            ),
+        )
+        now = time.monotonic()
+
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry and entry[0] > now:
+                self._cache.move_to_end(key)
+                value = entry[1]
+                return list(value) if isinstance(value, list) else value
+
+        value = func(self, *args, **kwargs)
+
+        # Failed lookups (None / empty lists) are retried next time
+        if value:
+            with self._cache_lock:
+                self._cache[key] = (now + CACHE_TTLS[func.__name__], value)
+                self._cache.move_to_end(key)
+                if len(self._cache) > CACHE_MAXSIZE:
+                    self._cache.popitem(last=False)
+            if isinstance(value, list):
+                value = list(value)
+
+        return value
+
+    return wrapper
+
+
+def invalidates(*methods):
+    """
+    Drop cached reads after a mutation
+
+    get_* entries are dropped only for the issue/PR number passed as the
+    first argument; everything else is dropped entirely.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        number_param = list(signature.parameters)[1]
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                arguments = signature.bind_partial(self, *args, **kwargs).arguments
+                number = arguments.get(number_param)
+                for method in methods:
+                    self._invalidate(
+                        method, number if method.startswith("get_") else None
+                    )
+
+        return wrapper
+
+    return decorator
+
+
+@dataclass(slots=True, frozen=True)
 class GitHubIssue:
-    """GitHub issue"""
+    """GitHub issue (immutable, so cached instances can be shared)"""
 
     number: int
     title: str
     body: str
     state: str
     created_by: str
-    labels: List[str]
-    assignees: List[str]
+    labels: Tuple[str, ...]
+    assignees: Tuple[str, ...]
     url: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GitHubPR:
-    """GitHub pull request"""
+    """GitHub pull request (immutable, so cached instances can be shared)"""
 
     number: int
     title: str
@@ -39,7 +178,7 @@ class GitHubPR:
     source_branch: str
     target_branch: str
     url: str
-    reviewers: List[str]
+    reviewers: Tuple[str, ...]
 
 
 class GitHubIntegration:
@@ -54,30 +193,231 @@ class GitHubIntegration:
     - Auto-label issues
     - Assign to room members
 
-    Requires: gh CLI installed and authenticated
+    Requires: a GitHub token (GH_TOKEN / GITHUB_TOKEN or `gh auth token`)
+    for the REST API, or gh CLI installed and authenticated
     """
 
-    def __init__(self, repo: str):
+    # gh auth state is looked up once per process, not per instance
+    _gh_checked = False
+    _gh_token_loaded = False
+    _gh_token: Optional[str] = None
+
+    def __init__(self, repo: str, token: Optional[str] = None):
         """
         Initialize GitHub integration
 
         Args:
             repo: Repository in format "owner/repo"
+            token: GitHub token. Defaults to GH_TOKEN / GITHUB_TOKEN, then the
+                token gh CLI is logged in with; without one, every call shells
+                out to the gh CLI instead.
         """
         self.repo = repo
-        self._check_gh_cli()
+        self._repo_args = ("--repo", repo)
+        self.token = (
+            token
+            or os.environ.get("GH_TOKEN")
+            or os.environ.get("GITHUB_TOKEN")
+            or self._gh_auth_token()
+        )
+        self._session = None
+        self._rate_limit_remaining = None
+        self._rate_limit_reset = 0.0
+        self._cache = OrderedDict()  # (method, *args) -> (expires_at, value)
+        self._cache_lock = threading.Lock()
+
+        if self.token:
+            # One pooled keep-alive session instead of a gh process per call
+            self._session = requests.Session()
+            self._session.mount(
+                GITHUB_API_URL, HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE)
+            )
+            self._session.headers.update(
+                {
+                    "Authorization": f"Bearer {self.token}",
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                }
+            )
+        else:
+            self._check_gh_cli()
+
+    def close(self):
+        """Close pooled REST connections"""
+        if self._session:
+            self._session.close()
+
+    def __enter__(self):
+        """Use as a context manager that closes the session on exit"""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the session"""
+        self.close()
+
+    @classmethod
+    def _gh_auth_token(cls) -> Optional[str]:
+        """Borrow gh CLI's stored token so calls can skip the gh subprocess"""
+        if cls._gh_token_loaded:
+            return cls._gh_token
+
+        try:
+            result = _gh_run(["gh", "auth", "token"], timeout=5)
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            result = None
+
+        if result is not None and result.returncode == 0:
+            cls._gh_token = result.stdout.strip() or None
+        cls._gh_token_loaded = True
 
-    def _check_gh_cli(self):
+        return cls._gh_token
+
+    @classmethod
+    def _check_gh_cli(cls):
         """Check if gh CLI is installed and authenticated"""
+        if cls._gh_checked:
+            return
+
         try:
-            result = subprocess.run(
-                ["gh", "auth", "status"], capture_output=True, text=True, timeout=5
-            )
+            result = _gh_run(["gh", "auth", "status"], timeout=5)
             if result.returncode != 0:
                 raise Exception("gh CLI not authenticated. Run: gh auth login")
         except FileNotFoundError:
             raise Exception("gh CLI not found. Install from: https://cli.github.com/")
 
+        cls._gh_checked = True
+
+    def _invalidate(self, method: str, number: Optional[int] = None):
+        """Drop cached reads for method (only for one issue/PR if number given)"""
+        with self._cache_lock:
+            stale = [
+                key
+                for key in self._cache
+                if key[0] == method and (number is None or key[1] == number)
+            ]
+            for key in stale:
+                del self._cache[key]
+
+    def _api(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+    ) -> requests.Response:
+        """
+        Call the GitHub REST API over the shared session
+
+        Sleeps until the rate-limit window resets when the previous
+        response reported no remaining requests.
+        """
+        if self._rate_limit_remaining == 0:
+            wait = self._rate_limit_reset - time.time()
+            if wait > 0:
+                time.sleep(wait)
+
+        response = self._session.request(
+            method,
+            f"{GITHUB_API_URL}/repos/{self.repo}{path}",
+            json=payload,
+            params=params,
+            timeout=HTTP_TIMEOUT,
+        )
+
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is not None:
+            self._rate_limit_remaining = int(remaining)
+            self._rate_limit_reset = float(response.headers.get("X-RateLimit-Reset", 0))
+
+        return response
+
+    @staticmethod
+    def _issue_from_api(data: Dict) -> GitHubIssue:
+        """Build GitHubIssue from a REST API issue object"""
+        return GitHubIssue(
+            number=data["number"],
+            title=data["title"],
+            body=data.get("body") or "",
+            state=data["state"].upper(),
+            created_by=(data.get("user") or {}).get("login", ""),
+            labels=tuple(label["name"] for label in data.get("labels", ())),
+            assignees=tuple(a["login"] for a in data.get("assignees", ())),
+            url=data["html_url"],
+        )
+
+    @staticmethod
+    def _issue_from_gh(data: Dict) -> GitHubIssue:
+        """Build GitHubIssue from gh --json output (missing fields stay empty)"""
+        return GitHubIssue(
+            number=data["number"],
+            title=data.get("title", ""),
+            body=data.get("body", ""),
+            state=data.get("state", ""),
+            created_by="",
+            labels=tuple(label["name"] for label in data.get("labels", ())),
+            assignees=tuple(a["login"] for a in data.get("assignees", ())),
+            url=data.get("url", ""),
+        )
+
+    @staticmethod
+    def _pr_from_gh(data: Dict) -> GitHubPR:
+        """Build GitHubPR from gh --json output (missing fields stay empty)"""
+        return GitHubPR(
+            number=data["number"],
+            title=data.get("title", ""),
+            body=data.get("body", ""),
+            state=data.get("state", ""),
+            created_by="",
+            source_branch=data.get("headRefName", ""),
+            target_branch=data.get("baseRefName", ""),
+            url=data.get("url", ""),
+            reviewers=(),
+        )
+
+    @staticmethod
+    def _gh_stream(cmd: List[str]) -> Iterator[Dict]:
+        """
+        Run a gh listing and yield its items as they arrive
+
+        `--jq '.[]'` makes gh print one compact JSON object per line, so
+        items are parsed one at a time instead of buffering the whole array.
+        """
+        proc = subprocess.Popen(
+            [_gh_executable(), *cmd[1:], "--jq", ".[]"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            close_fds=False,  # see _gh_run
+        )
+        try:
+            for line in proc.stdout:
+                if line.strip():
+                    yield json.loads(line)
+        finally:
+            proc.stdout.close()
+            try:
+                proc.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+
+    @staticmethod
+    def _pr_from_api(data: Dict) -> GitHubPR:
+        """Build GitHubPR from a REST API pull request object"""
+        state = "MERGED" if data.get("merged_at") else data["state"].upper()
+        return GitHubPR(
+            number=data["number"],
+            title=data["title"],
+            body=data.get("body") or "",
+            state=state,
+            created_by=(data.get("user") or {}).get("login", ""),
+            source_branch=data["head"]["ref"],
+            target_branch=data["base"]["ref"],
+            url=data["html_url"],
+            reviewers=tuple(r["login"] for r in data.get("requested_reviewers", ())),
+        )
+
+    @invalidates("list_open_issues")
     def create_issue(
         self,
         title: str,
@@ -105,15 +445,40 @@ class GitHubIntegration:
         full_body = body
         if room_link:
             full_body += f"\n\n---\n🤝 Created from collaboration room: {room_link}"
-        full_body += f"\n👤 Created by: {created_by}"
+        if created_by:
+            full_body += f"\n👤 Created by: {created_by}"
+
+        if self._session:
+            response = self._api(
+                "POST",
+                "/issues",
+                {
+                    "title": title,
+                    "body": full_body,
+                    "labels": labels or [],
+                    "assignees": assignees or [],
+                },
+            )
+            if not response.ok:
+                raise Exception(f"Failed to create issue: {response.text}")
+
+            data = response.json()
+            return GitHubIssue(
+                number=data["number"],
+                title=title,
+                body=full_body,
+                state="open",
+                created_by=created_by,
+                labels=tuple(labels or ()),
+                assignees=tuple(assignees or ()),
+                url=data["html_url"],
+            )
 
         # Build command
         cmd = [
-            "gh",
-            "issue",
+            *GH_ISSUE,
             "create",
-            "--repo",
-            self.repo,
+            *self._repo_args,
             "--title",
             title,
             "--body",
@@ -127,7 +492,7 @@ class GitHubIntegration:
             cmd.extend(["--assignee", ",".join(assignees)])
 
         # Execute
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = _gh_run(cmd)
 
         if result.returncode != 0:
             raise Exception(f"Failed to create issue: {result.stderr}")
@@ -144,11 +509,12 @@ class GitHubIntegration:
             body=full_body,
             state="open",
             created_by=created_by,
-            labels=labels or [],
-            assignees=assignees or [],
+            labels=tuple(labels or ()),
+            assignees=tuple(assignees or ()),
             url=issue_url,
         )
 
+    @invalidates("list_open_prs")
     def create_pr(
         self,
         title: str,
@@ -181,13 +547,45 @@ class GitHubIntegration:
         if created_by:
             full_body += f"\n👤 Created by: {created_by}"
 
+        if self._session:
+            response = self._api(
+                "POST",
+                "/pulls",
+                {
+                    "title": title,
+                    "body": full_body,
+                    "head": source_branch,
+                    "base": target_branch,
+                },
+            )
+            if not response.ok:
+                raise Exception(f"Failed to create PR: {response.text}")
+
+            data = response.json()
+            if reviewers:
+                self._api(
+                    "POST",
+                    f"/pulls/{data['number']}/requested_reviewers",
+                    {"reviewers": reviewers},
+                )
+
+            return GitHubPR(
+                number=data["number"],
+                title=title,
+                body=full_body,
+                state="open",
+                created_by=created_by,
+                source_branch=source_branch,
+                target_branch=target_branch,
+                url=data["html_url"],
+                reviewers=tuple(reviewers or ()),
+            )
+
         # Build command
         cmd = [
-            "gh",
-            "pr",
+            *GH_PR,
             "create",
-            "--repo",
-            self.repo,
+            *self._repo_args,
             "--title",
             title,
             "--body",
@@ -202,7 +600,7 @@ class GitHubIntegration:
             cmd.extend(["--reviewer", ",".join(reviewers)])
 
         # Execute
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = _gh_run(cmd)
 
         if result.returncode != 0:
             raise Exception(f"Failed to create PR: {result.stderr}")
@@ -219,9 +617,10 @@ class GitHubIntegration:
             source_branch=source_branch,
             target_branch=target_branch,
             url=pr_url,
-            reviewers=reviewers or [],
+            reviewers=tuple(reviewers or ()),
         )
 
+    @invalidates("get_pr")
     def add_pr_review(
         self, pr_number: int, reviewer: str, approve: bool = True, comment: str = ""
     ) -> bool:
@@ -239,23 +638,28 @@ class GitHubIntegration:
         """
         review_state = "APPROVE" if approve else "REQUEST_CHANGES"
 
+        if self._session:
+            payload = {"event": review_state}
+            if comment:
+                payload["body"] = f"{comment}\n\n🤝 Review from: {reviewer}"
+            return self._api("POST", f"/pulls/{pr_number}/reviews", payload).ok
+
         cmd = [
-            "gh",
-            "pr",
+            *GH_PR,
             "review",
             str(pr_number),
-            "--repo",
-            self.repo,
+            *self._repo_args,
             "--" + review_state.lower().replace("_", "-"),
         ]
 
         if comment:
             cmd.extend(["--body", f"{comment}\n\n🤝 Review from: {reviewer}"])
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = _gh_run(cmd)
 
         return result.returncode == 0
 
+    @invalidates("get_issue")
     def add_issue_comment(self, issue_number: int, author: str, comment: str) -> bool:
         """
         Add comment to issue
@@ -268,34 +672,48 @@ class GitHubIntegration:
         Returns:
             True if comment added
         """
-        full_comment = f"{comment}\n\n👤 {author}"
+        full_comment = f"{comment}\n\n👤 {author}" if author else comment
+
+        if self._session:
+            return self._api(
+                "POST", f"/issues/{issue_number}/comments", {"body": full_comment}
+            ).ok
 
         cmd = [
-            "gh",
-            "issue",
+            *GH_ISSUE,
             "comment",
             str(issue_number),
-            "--repo",
-            self.repo,
+            *self._repo_args,
             "--body",
             full_comment,
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = _gh_run(cmd)
 
         return result.returncode == 0
 
+    @invalidates("get_issue", "list_open_issues")
     def close_issue(self, issue_number: int, reason: str = "") -> bool:
         """Close issue"""
-        cmd = ["gh", "issue", "close", str(issue_number), "--repo", self.repo]
+        if self._session:
+            if reason:
+                self._api(
+                    "POST",
+                    f"/issues/{issue_number}/comments",
+                    {"body": f"Closing: {reason}"},
+                )
+            return self._api("PATCH", f"/issues/{issue_number}", {"state": "closed"}).ok
+
+        cmd = [*GH_ISSUE, "close", str(issue_number), *self._repo_args]
 
         if reason:
             cmd.extend(["--comment", f"Closing: {reason}"])
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = _gh_run(cmd)
 
         return result.returncode == 0
 
+    @invalidates("get_pr", "list_open_prs")
     def merge_pr(self, pr_number: int, merge_method: str = "squash") -> bool:
         """
         Merge pull request
@@ -307,158 +725,190 @@ class GitHubIntegration:
         Returns:
             True if merged
         """
-        cmd = [
-            "gh",
-            "pr",
-            "merge",
-            str(pr_number),
-            "--repo",
-            self.repo,
-            "--" + merge_method,
-        ]
+        if self._session:
+            return self._api(
+                "PUT", f"/pulls/{pr_number}/merge", {"merge_method": merge_method}
+            ).ok
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        cmd = [*GH_PR, "merge", str(pr_number), *self._repo_args, "--" + merge_method]
+
+        result = _gh_run(cmd)
 
         return result.returncode == 0
 
-    def get_issue(self, issue_number: int) -> Optional[GitHubIssue]:
-        """Get issue details"""
+    @cached_read
+    def get_issue(
+        self, issue_number: int, fields: Tuple[str, ...] = ISSUE_FIELDS
+    ) -> Optional[GitHubIssue]:
+        """
+        Get issue details
+
+        fields limits the gh --json projection (gh CLI path only); fields
+        left out are filled with empty values.
+        """
+        if self._session:
+            response = self._api("GET", f"/issues/{issue_number}")
+            return self._issue_from_api(response.json()) if response.ok else None
+
         cmd = [
-            "gh",
-            "issue",
+            *GH_ISSUE,
             "view",
             str(issue_number),
-            "--repo",
-            self.repo,
+            *self._repo_args,
             "--json",
-            "number,title,body,state,labels,assignees,url",
+            _json_arg(tuple(fields)),
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = _gh_run(cmd)
 
         if result.returncode != 0:
             return None
 
-        data = json.loads(result.stdout)
+        return self._issue_from_gh(json.loads(result.stdout))
 
-        return GitHubIssue(
-            number=data["number"],
-            title=data["title"],
-            body=data["body"],
-            state=data["state"],
-            created_by="",
-            labels=[label["name"] for label in data.get("labels", [])],
-            assignees=[assignee["login"] for assignee in data.get("assignees", [])],
-            url=data["url"],
-        )
+    @cached_read
+    def get_pr(
+        self, pr_number: int, fields: Tuple[str, ...] = PR_FIELDS
+    ) -> Optional[GitHubPR]:
+        """Get PR details (fields: gh --json projection, as in get_issue)"""
+        if self._session:
+            response = self._api("GET", f"/pulls/{pr_number}")
+            return self._pr_from_api(response.json()) if response.ok else None
 
-    def get_pr(self, pr_number: int) -> Optional[GitHubPR]:
-        """Get PR details"""
         cmd = [
-            "gh",
-            "pr",
+            *GH_PR,
             "view",
             str(pr_number),
-            "--repo",
-            self.repo,
+            *self._repo_args,
             "--json",
-            "number,title,body,state,headRefName,baseRefName,url",
+            _json_arg(tuple(fields)),
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = _gh_run(cmd)
 
         if result.returncode != 0:
             return None
 
-        data = json.loads(result.stdout)
-
-        return GitHubPR(
-            number=data["number"],
-            title=data["title"],
-            body=data["body"],
-            state=data["state"],
-            created_by="",
-            source_branch=data["headRefName"],
-            target_branch=data["baseRefName"],
-            url=data["url"],
-            reviewers=[],
-        )
+        return self._pr_from_gh(json.loads(result.stdout))
 
+    @cached_read
     def list_open_issues(
-        self, labels: List[str] = None, limit: int = 10
+        self,
+        labels: List[str] = None,
+        limit: int = 10,
+        fields: Tuple[str, ...] = ISSUE_FIELDS,
     ) -> List[GitHubIssue]:
-        """List open issues"""
+        """List open issues (fields: gh --json projection, as in get_issue)"""
+        return list(self.iter_open_issues(labels, limit, fields))
+
+    def iter_open_issues(
+        self,
+        labels: List[str] = None,
+        limit: int = 10,
+        fields: Tuple[str, ...] = ISSUE_FIELDS,
+    ) -> Iterator[GitHubIssue]:
+        """Yield open issues as they are read (uncached)"""
+        if self._session:
+            params = {"state": "open", "per_page": min(limit, 100)}
+            if labels:
+                params["labels"] = ",".join(labels)
+            response = self._api("GET", "/issues", params=params)
+            if not response.ok:
+                return
+
+            # The issues endpoint also returns pull requests
+            issues = (item for item in response.json() if "pull_request" not in item)
+            for item in islice(issues, limit):
+                yield self._issue_from_api(item)
+            return
+
         cmd = [
-            "gh",
-            "issue",
+            *GH_ISSUE,
             "list",
-            "--repo",
-            self.repo,
+            *self._repo_args,
             "--limit",
             str(limit),
             "--json",
-            "number,title,body,state,labels,assignees,url",
+            _json_arg(tuple(fields)),
         ]
 
         if labels:
             cmd.extend(["--label", ",".join(labels)])
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-        if result.returncode != 0:
-            return []
-
-        data = json.loads(result.stdout)
-
-        return [
-            GitHubIssue(
-                number=item["number"],
-                title=item["title"],
-                body=item["body"],
-                state=item["state"],
-                created_by="",
-                labels=[label["name"] for label in item.get("labels", [])],
-                assignees=[assignee["login"] for assignee in item.get("assignees", [])],
-                url=item["url"],
-            )
-            for item in data
-        ]
+        for item in self._gh_stream(cmd):
+            yield self._issue_from_gh(item)
+
+    @cached_read
+    def list_open_prs(
+        self, limit: int = 10, fields: Tuple[str, ...] = PR_FIELDS
+    ) -> List[GitHubPR]:
+        """List open pull requests (fields: gh --json projection)"""
+        return list(self.iter_open_prs(limit, fields))
+
+    def iter_open_prs(
+        self, limit: int = 10, fields: Tuple[str, ...] = PR_FIELDS
+    ) -> Iterator[GitHubPR]:
+        """Yield open pull requests as they are read (uncached)"""
+        if self._session:
+            params = {"state": "open", "per_page": min(limit, 100)}
+            response = self._api("GET", "/pulls", params=params)
+            if not response.ok:
+                return
+
+            for item in response.json():
+                yield self._pr_from_api(item)
+            return
 
-    def list_open_prs(self, limit: int = 10) -> List[GitHubPR]:
-        """List open pull requests"""
         cmd = [
-            "gh",
-            "pr",
+            *GH_PR,
             "list",
-            "--repo",
-            self.repo,
+            *self._repo_args,
             "--limit",
             str(limit),
             "--json",
-            "number,title,body,state,headRefName,baseRefName,url",
+            _json_arg(tuple(fields)),
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        for item in self._gh_stream(cmd):
+            yield self._pr_from_gh(item)
 
-        if result.returncode != 0:
+    def batch_fetch(self, calls: List[Tuple[Callable, ...]]) -> List[Any]:
+        """
+        Run independent GitHub calls concurrently
+
+        Args:
+            calls: (method, *args) tuples, e.g. [(self.get_issue, 12)]
+
+        Returns:
+            Results in call order; a call that raised yields None
+        """
+        if not calls:
             return []
 
-        data = json.loads(result.stdout)
-
-        return [
-            GitHubPR(
-                number=item["number"],
-                title=item["title"],
-                body=item["body"],
-                state=item["state"],
-                created_by="",
-                source_branch=item["headRefName"],
-                target_branch=item["baseRefName"],
-                url=item["url"],
-                reviewers=[],
-            )
-            for item in data
-        ]
+        def run(call):
+            func, *args = call
+            try:
+                return func(*args)
+            except Exception:
+                logger.warning(
+                    "GitHub call %s%r failed",
+                    func.__name__,
+                    tuple(args),
+                    exc_info=True,
+                )
+                return None
+
+        # Capped to stay well inside GitHub's secondary rate limits
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(calls))) as pool:
+            return list(pool.map(run, calls))
+
+    def get_issues(self, numbers: List[int]) -> List[Optional[GitHubIssue]]:
+        """Get several issues concurrently"""
+        return self.batch_fetch([(self.get_issue, n) for n in numbers])
+
+    def get_prs(self, numbers: List[int]) -> List[Optional[GitHubPR]]:
+        """Get several PRs concurrently"""
+        return self.batch_fetch([(self.get_pr, n) for n in numbers])
 
 
 # Integration with collaboration room
@@ -473,6 +923,13 @@ class CollabRoomGitHub:
         self.issue_map = {}  # room_decision_id -> github_issue_number
         self.pr_map = {}  # room_task_id -> github_pr_number
 
+        # id -> decision/task; room lists are append-only, so only entries
+        # appended since the last miss need indexing
+        self._decision_index = {}
+        self._decisions_indexed = 0
+        self._task_index = {}
+        self._tasks_indexed = 0
+
     def decision_to_issue(self, decision_id: str) -> Optional[GitHubIssue]:
         """
         Convert room decision to GitHub issue
@@ -483,23 +940,12 @@ class CollabRoomGitHub:
         Returns:
             Created issue
         """
-        decision = None
-        for d in self.room.decisions:
-            if d.id == decision_id:
-                decision = d
-                break
+        decision = self._find_decision(decision_id)
 
         if not decision:
             return None
 
-        # Create issue
-        issue = self.github.create_issue(
-            title=f"[Decision] {decision.text}",
-            body=f"Decision from collaboration room\n\nProposed by: {decision.proposed_by}",
-            created_by=decision.proposed_by,
-            labels=["decision", "collaboration-room"],
-            room_link=f"Room: {self.room.room_id}",
-        )
+        issue = self._create_decision_issue(decision)
 
         self.issue_map[decision_id] = issue.number
 
@@ -510,6 +956,67 @@ class CollabRoomGitHub:
 
         return issue
 
+    def decisions_to_issues(
+        self, decision_ids: List[str]
+    ) -> Dict[str, Optional[GitHubIssue]]:
+        """
+        Convert several room decisions to GitHub issues concurrently
+
+        Args:
+            decision_ids: Decision IDs from room
+
+        Returns:
+            decision_id -> created issue (None if not found or failed)
+        """
+        decisions = [self._find_decision(d_id) for d_id in decision_ids]
+        found = [d for d in decisions if d]
+
+        issues = self.github.batch_fetch(
+            [(self._create_decision_issue, d) for d in found]
+        )
+
+        results = dict.fromkeys(decision_ids)
+        for decision, issue in zip(found, issues):
+            if not issue:
+                continue
+            results[decision.id] = issue
+            self.issue_map[decision.id] = issue.number
+            self.room.send_message(
+                "SYSTEM", f"✅ Created GitHub issue #{issue.number}: {issue.url}"
+            )
+
+        return results
+
+    def _find_decision(self, decision_id: str):
+        """Look up a room decision by ID"""
+        decision = self._decision_index.get(decision_id)
+        if decision is None and self._decisions_indexed < len(self.room.decisions):
+            for d in self.room.decisions[self._decisions_indexed :]:
+                self._decision_index[d.id] = d
+            self._decisions_indexed = len(self.room.decisions)
+            decision = self._decision_index.get(decision_id)
+        return decision
+
+    def _find_task(self, task_id: str):
+        """Look up a room task by ID"""
+        task = self._task_index.get(task_id)
+        if task is None and self._tasks_indexed < len(self.room.tasks):
+            for t in self.room.tasks[self._tasks_indexed :]:
+                self._task_index[t["id"]] = t
+            self._tasks_indexed = len(self.room.tasks)
+            task = self._task_index.get(task_id)
+        return task
+
+    def _create_decision_issue(self, decision) -> GitHubIssue:
+        """Create the GitHub issue for a room decision"""
+        return self.github.create_issue(
+            title=f"[Decision] {decision.text}",
+            body=f"Decision from collaboration room\n\nProposed by: {decision.proposed_by}",
+            created_by=decision.proposed_by,
+            labels=["decision", "collaboration-room"],
+            room_link=f"Room: {self.room.room_id}",
+        )
+
     def task_to_pr(self, task_id: str, branch: str) -> Optional[GitHubPR]:
         """
         Convert room task to GitHub PR
@@ -521,11 +1028,7 @@ class CollabRoomGitHub:
         Returns:
             Created PR
         """
-        task = None
-        for t in self.room.tasks:
-            if t["id"] == task_id:
-                task = t
-                break
+        task = self._find_task(task_id)
 
         if not task:
             return None
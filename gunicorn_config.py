@@ -16,9 +16,13 @@ backlog = 2048
 # CPU-bound: (2 * cpu_count) + 1
 # I/O-bound: (cpu_count * 4) + 1 (recommended for WebSocket/async workloads)
 workers = (multiprocessing.cpu_count() * 2) + 1
-worker_class = "gthread"  # Thread-based worker (compatible with flask_sock WebSockets)
-threads = 4
-worker_connections = 1000
+# gevent: one event loop per worker multiplexes every WebSocket on epoll instead
+# of parking an OS thread per connection. The worker monkey-patches the stdlib
+# before loading the app, so server_ws's background threads become greenlets.
+# Set GUNICORN_WORKER_CLASS=gthread to fall back to thread-based workers.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gevent")
+threads = 4  # Only used by gthread
+worker_connections = 10000  # Max concurrent clients per gevent worker
 timeout = 120
 keepalive = 5
 
@@ -3,18 +3,89 @@
 Health Check System for Multi-Agent Bridge
 Kubernetes-style liveness and readiness probes
 """
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, jsonify
+from werkzeug.middleware.dispatcher import DispatcherMiddleware
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Dict, List, Callable, Optional
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import time
-import psutil
+import threading
+import json
 import logging
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+RESOURCE_CACHE_TTL = 2.0  # seconds a psutil reading is reused across probes
+PROBE_CACHE_TTL = RESOURCE_CACHE_TTL  # seconds a serialized probe response is reused
+
+
+# psutil (native init) and requests (TLS setup) load on first use, not import
+psutil = None
+_http_session = None
+
+
+def _get_psutil():
+    """Import psutil on first use"""
+    global psutil
+    if psutil is None:
+        import psutil as psutil_module
+
+        # Non-blocking cpu_percent() reports usage since the previous call;
+        # prime it so later readings cover a real interval
+        psutil_module.cpu_percent(interval=None)
+        psutil = psutil_module
+    return psutil
+
+
+def _get_http_session():
+    """Shared keep-alive session for external API checks"""
+    global _http_session
+    if _http_session is None:
+        import requests
+
+        _http_session = requests.Session()
+    return _http_session
+
+
+_timestamp = (0, "")  # (unix second, ISO-8601 string for that second)
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO-8601, formatted at most once per second"""
+    global _timestamp
+    second = int(time.time())
+    if second != _timestamp[0]:
+        _timestamp = (
+            second,
+            datetime.fromtimestamp(second, timezone.utc).isoformat(),
+        )
+    return _timestamp[1]
+
+
+_HTTP_STATUS = {
+    200: "200 OK",
+    404: "404 NOT FOUND",
+    405: "405 METHOD NOT ALLOWED",
+    503: "503 SERVICE UNAVAILABLE",
+}
+
+
+def _dumps(payload: Dict) -> bytes:
+    """Serialize a probe response to JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheck:
     """
     Individual health check
@@ -68,20 +139,51 @@ class HealthCheckManager:
         self.start_time = time.time()
         self.last_check_results = {}
 
+        # psutil readings shared by probes: name -> (taken_at, value)
+        self._resource_cache = {}
+        self._resource_lock = threading.Lock()
+
+        # Serialized probe responses: probe -> (taken_at, body, status_code)
+        self._probe_cache = {}
+        self._wsgi_probes = {
+            "/live": self._liveness_result,
+            "/ready": self._readiness_result,
+            "/status": self._status_result,
+        }
+
+        # Checks run concurrently so one slow check doesn't stall the probe
+        self._pool = ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix="health-check"
+        )
+
         # Register built-in checks
         self._register_builtin_checks()
 
         if app:
             self.register_routes(app)
 
+    def _resource(self, name: str, read: Callable):
+        """Return a cached psutil reading, refreshed at most every RESOURCE_CACHE_TTL"""
+        now = time.monotonic()
+
+        with self._resource_lock:
+            cached = self._resource_cache.get(name)
+            if cached and now - cached[0] < RESOURCE_CACHE_TTL:
+                return cached[1]
+
+            value = read()
+            self._resource_cache[name] = (now, value)
+            return value
+
     def _register_builtin_checks(self):
         """Register default health checks"""
 
         # System resources check
         def check_system_resources():
             """Check CPU and memory are not maxed out"""
-            cpu = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
+            ps = _get_psutil()
+            cpu = self._resource("cpu", lambda: ps.cpu_percent(interval=None))
+            memory = self._resource("memory", ps.virtual_memory)
 
             if cpu > 95:
                 return False, f"CPU at {cpu}%"
@@ -101,7 +203,7 @@ class HealthCheckManager:
         # Disk space check
         def check_disk_space():
             """Check disk space available"""
-            disk = psutil.disk_usage("/")
+            disk = self._resource("disk", lambda: _get_psutil().disk_usage("/"))
 
             if disk.percent > 95:
                 return False, f"Disk at {disk.percent}%"
@@ -134,10 +236,14 @@ class HealthCheckManager:
         """
         self.readiness_checks.append(check)
 
-    def check_liveness(self) -> Dict:
+    def check_liveness(self, shared_results: Optional[Dict] = None) -> Dict:
         """
         Execute liveness checks
 
+        Args:
+            shared_results: Results already computed this round, by check name;
+                matching checks are not run again
+
         Returns:
             {
                 'status': 'healthy' | 'unhealthy',
@@ -145,91 +251,202 @@ class HealthCheckManager:
                 'uptime': seconds
             }
         """
-        results = self._run_checks(self.liveness_checks)
+        results = self._run_checks(self.liveness_checks, shared_results)
 
         # Any critical check failing = unhealthy
-        critical_failures = [
-            name
-            for name, result in results["checks"].items()
-            if not result["passed"] and result["critical"]
-        ]
-
-        status = "unhealthy" if critical_failures else "healthy"
+        status = "unhealthy" if results["any_critical_failed"] else "healthy"
 
         return {
             "status": status,
             "checks": results["checks"],
             "uptime": time.time() - self.start_time,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utc_timestamp(),
         }
 
-    def check_readiness(self) -> Dict:
+    def check_readiness(self, shared_results: Optional[Dict] = None) -> Dict:
         """
         Execute readiness checks
 
+        Args:
+            shared_results: As for check_liveness
+
         Returns:
             {
                 'status': 'ready' | 'not_ready',
                 'checks': {...}
             }
         """
-        results = self._run_checks(self.readiness_checks)
+        results = self._run_checks(self.readiness_checks, shared_results)
 
         # Any critical check failing = not ready
-        critical_failures = [
-            name
-            for name, result in results["checks"].items()
-            if not result["passed"] and result["critical"]
-        ]
-
-        status = "not_ready" if critical_failures else "ready"
+        status = "not_ready" if results["any_critical_failed"] else "ready"
 
         return {
             "status": status,
             "checks": results["checks"],
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utc_timestamp(),
         }
 
-    def _run_checks(self, checks: List[HealthCheck]) -> Dict:
-        """Run a list of health checks"""
-        check_results = {}
+    def _run_checks(
+        self, checks: List[HealthCheck], shared_results: Optional[Dict] = None
+    ) -> Dict:
+        """Run a list of health checks concurrently, each within its timeout"""
+        shared_results = shared_results or {}
+        enabled = [check for check in checks if check.enabled]
+        start = time.time()
+        futures = {
+            check.name: self._pool.submit(self._run_check, check)
+            for check in enabled
+            if check.name not in shared_results
+        }
 
-        for check in checks:
-            if not check.enabled:
-                continue
+        check_results = {}
+        passed = failed = 0
+        any_critical_failed = False
 
-            start = time.time()
+        for check in enabled:
+            remaining = max(0.0, start + check.timeout - time.time())
 
             try:
-                passed, message = check.check_func()
-                duration = time.time() - start
-
-                check_results[check.name] = {
-                    "passed": passed,
-                    "message": message,
-                    "duration": duration,
-                    "critical": check.critical,
-                }
-
-            except Exception as e:
-                duration = time.time() - start
-
-                check_results[check.name] = {
+                if check.name in shared_results:
+                    result = shared_results[check.name]
+                else:
+                    result = futures[check.name].result(timeout=remaining)
+            except FutureTimeoutError:
+                result = {
                     "passed": False,
-                    "message": f"Check failed: {str(e)}",
-                    "duration": duration,
+                    "message": f"Check timed out after {check.timeout}s",
+                    "duration": time.time() - start,
                     "critical": check.critical,
                 }
 
+            check_results[check.name] = result
+            if result["passed"]:
+                passed += 1
+            else:
+                failed += 1
+                any_critical_failed = any_critical_failed or check.critical
+
         self.last_check_results = check_results
 
         return {
             "checks": check_results,
             "total": len(checks),
-            "passed": sum(1 for r in check_results.values() if r["passed"]),
-            "failed": sum(1 for r in check_results.values() if not r["passed"]),
+            "passed": passed,
+            "failed": failed,
+            "any_critical_failed": any_critical_failed,
+        }
+
+    @staticmethod
+    def _run_check(check: HealthCheck) -> Dict:
+        """Run a single health check (on a pool thread)"""
+        start = time.time()
+
+        try:
+            passed, message = check.check_func()
+        except Exception as e:
+            passed, message = False, f"Check failed: {str(e)}"
+
+        return {
+            "passed": passed,
+            "message": message,
+            "duration": time.time() - start,
+            "critical": check.critical,
         }
 
+    def _cached_probe(self, probe: str, run: Callable[[], tuple]) -> tuple:
+        """Return (body, status_code), rerunning the probe once per PROBE_CACHE_TTL"""
+        now = time.monotonic()
+        cached = self._probe_cache.get(probe)
+        if cached and now - cached[0] < PROBE_CACHE_TTL:
+            return cached[1], cached[2]
+
+        result, status_code = run()
+        body = _dumps(result)
+        self._probe_cache[probe] = (now, body, status_code)
+        return body, status_code
+
+    def _liveness_result(self) -> tuple:
+        """Liveness result with its HTTP status code"""
+        result = self.check_liveness()
+        return result, 200 if result["status"] == "healthy" else 503
+
+    def _readiness_result(self) -> tuple:
+        """Readiness result with its HTTP status code"""
+        result = self.check_readiness()
+        return result, 200 if result["status"] == "ready" else 503
+
+    def _status_result(self) -> tuple:
+        """Combined liveness + readiness status with its HTTP status code"""
+        # Checks registered for both probes (by name) run only once
+        union = {
+            check.name: check
+            for check in self.liveness_checks + self.readiness_checks
+            if check.enabled
+        }
+        shared_results = self._run_checks(list(union.values()))["checks"]
+
+        liveness = self.check_liveness(shared_results)
+        readiness = self.check_readiness(shared_results)
+
+        overall_status = "healthy"
+        if liveness["status"] == "unhealthy":
+            overall_status = "unhealthy"
+        elif readiness["status"] == "not_ready":
+            overall_status = "degraded"
+
+        return {
+            "status": overall_status,
+            "liveness": liveness,
+            "readiness": readiness,
+        }, 200
+
+    def _startup_result(self) -> tuple:
+        """Startup status with its HTTP status code"""
+        uptime = time.time() - self.start_time
+
+        # Consider started after 5 seconds
+        started = uptime > 5
+
+        return {
+            "status": "started" if started else "starting",
+            "uptime": uptime,
+        }, (200 if started else 503)
+
+    def wsgi_app(self, environ, start_response):
+        """
+        Bare WSGI app serving /live, /ready, /startup and /status
+
+        Skips Flask's routing, request context and response objects; see
+        mount_wsgi().
+        """
+        path = environ.get("PATH_INFO", "")
+
+        if environ.get("REQUEST_METHOD") not in ("GET", "HEAD"):
+            body, status_code = b'{"error":"method not allowed"}', 405
+        elif path == "/startup":
+            result, status_code = self._startup_result()
+            body = _dumps(result)
+        elif path in self._wsgi_probes:
+            body, status_code = self._cached_probe(path[1:], self._wsgi_probes[path])
+        else:
+            body, status_code = b'{"error":"not found"}', 404
+
+        start_response(
+            _HTTP_STATUS[status_code],
+            [("Content-Type", "application/json"), ("Content-Length", str(len(body)))],
+        )
+        return [body]
+
+    def mount_wsgi(self, app):
+        """
+        Serve /health/* from wsgi_app ahead of Flask
+
+        Probes no longer pass through Flask (before_request hooks, CORS,
+        etc. don't apply to them), which makes each one far cheaper.
+        """
+        app.wsgi_app = DispatcherMiddleware(app.wsgi_app, {"/health": self.wsgi_app})
+
     def register_routes(self, app):
         """Register health check routes on Flask app"""
         bp = Blueprint("health", __name__, url_prefix="/health")
@@ -242,11 +459,9 @@ class HealthCheckManager:
             Returns 200 if healthy, 503 if unhealthy.
             Used by Kubernetes to restart unhealthy pods.
             """
-            result = self.check_liveness()
+            body, status_code = self._cached_probe("live", self._liveness_result)
 
-            status_code = 200 if result["status"] == "healthy" else 503
-
-            return jsonify(result), status_code
+            return Response(body, status=status_code, mimetype="application/json")
 
         @bp.route("/ready", methods=["GET"])
         def readiness_probe():
@@ -256,11 +471,9 @@ class HealthCheckManager:
             Returns 200 if ready, 503 if not ready.
             Used by Kubernetes to route traffic only to ready pods.
             """
-            result = self.check_readiness()
+            body, status_code = self._cached_probe("ready", self._readiness_result)
 
-            status_code = 200 if result["status"] == "ready" else 503
-
-            return jsonify(result), status_code
+            return Response(body, status=status_code, mimetype="application/json")
 
         @bp.route("/startup", methods=["GET"])
         def startup_probe():
@@ -270,14 +483,9 @@ class HealthCheckManager:
             Returns 200 once application is fully initialized.
             Delays liveness/readiness checks until startup complete.
             """
-            uptime = time.time() - self.start_time
-
-            # Consider started after 5 seconds
-            started = uptime > 5
+            result, status_code = self._startup_result()
 
-            return jsonify(
-                {"status": "started" if started else "starting", "uptime": uptime}
-            ), (200 if started else 503)
+            return jsonify(result), status_code
 
         @bp.route("/status", methods=["GET"])
         def health_status():
@@ -286,18 +494,9 @@ class HealthCheckManager:
 
             Returns detailed status of all checks.
             """
-            liveness = self.check_liveness()
-            readiness = self.check_readiness()
-
-            overall_status = "healthy"
-            if liveness["status"] == "unhealthy":
-                overall_status = "unhealthy"
-            elif readiness["status"] == "not_ready":
-                overall_status = "degraded"
+            body, status_code = self._cached_probe("status", self._status_result)
 
-            return jsonify(
-                {"status": overall_status, "liveness": liveness, "readiness": readiness}
-            )
+            return Response(body, status=status_code, mimetype="application/json")
 
         app.register_blueprint(bp)
 
@@ -341,10 +540,8 @@ class CommonChecks:
         """Check external API availability"""
 
         def check():
-            import requests
-
             try:
-                response = requests.get(url, timeout=timeout)
+                response = _get_http_session().get(url, timeout=timeout)
                 if response.status_code < 500:
                     return True, f"API responsive ({response.status_code})"
                 else:
@@ -391,7 +588,7 @@ class CommonChecks:
 
         def check():
             try:
-                disk = psutil.disk_usage(path)
+                disk = _get_psutil().disk_usage(path)
                 free_gb = disk.free / (1024**3)
 
                 if free_gb < min_free_gb:
@@ -6,12 +6,31 @@ Tracks tasks across todo, in_progress, review, done states
 Identified in collaborative brainstorming as Priority 2 improvement
 """
 import uuid
-import json
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, field, asdict
+import heapq
+import asyncio
+from collections import Counter, defaultdict, deque
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+__all__ = [
+    "TaskStatus",
+    "TaskPriority",
+    "Comment",
+    "KanbanTask",
+    "BoardColumn",
+    "KanbanBoard",
+    "KanbanBoardManager",
+]
+
 
 class TaskStatus(Enum):
     """Task status states"""
@@ -33,7 +52,22 @@ class TaskPriority(Enum):
     URGENT = "urgent"
 
 
-@dataclass
+# (member, value) pairs, so hot loops don't go through Enum.value per task
+_STATUS_VALUES = tuple((status, status.value) for status in TaskStatus)
+_PRIORITY_VALUES = tuple((priority, priority.value) for priority in TaskPriority)
+_DONE_VALUE = TaskStatus.DONE.value
+
+
+class Comment(NamedTuple):
+    """Comment on a task"""
+
+    id: str
+    author: str
+    text: str
+    timestamp: str
+
+
+@dataclass(slots=True)
 class KanbanTask:
     """Task on kanban board"""
 
@@ -50,18 +84,18 @@ class KanbanTask:
     tags: Set[str] = field(default_factory=set)
     dependencies: Set[str] = field(default_factory=set)  # Task IDs that block this
     subtasks: List[str] = field(default_factory=list)
-    comments: List[Dict] = field(default_factory=list)
+    comments: List[Comment] = field(default_factory=list)
     time_spent_minutes: int = 0
     estimated_minutes: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class BoardColumn:
     """Column on kanban board"""
 
     status: TaskStatus
     name: str
-    tasks: List[str] = field(default_factory=list)  # Task IDs
+    tasks: Dict[str, None] = field(default_factory=dict)  # Task IDs, ordered
     wip_limit: Optional[int] = None  # Work-in-progress limit
 
 
@@ -80,6 +114,17 @@ class KanbanBoard:
     - Board analytics
     """
 
+    # KanbanTask fields exported as-is; the rest are converted in _export_task
+    _EXPORT_FIELDS = (
+        "id",
+        "title",
+        "description",
+        "assignee",
+        "created_by",
+        "time_spent_minutes",
+        "estimated_minutes",
+    )
+
     def __init__(self, board_id: str, name: str):
         self.board_id = board_id
         self.name = name
@@ -99,11 +144,41 @@ class KanbanBoard:
                 TaskStatus.BLOCKED, "Blocked", wip_limit=None
             ),
             TaskStatus.DONE: BoardColumn(TaskStatus.DONE, "Done", wip_limit=None),
+            TaskStatus.ARCHIVED: BoardColumn(
+                TaskStatus.ARCHIVED, "Archived", wip_limit=None
+            ),
         }
 
         # Members
         self.members: Set[str] = set()
 
+        # Dependency graph, kept current by add_dependency / move_task:
+        # task -> number of dependencies not yet DONE, dependency -> tasks
+        # waiting on it, and the tasks with at least one unresolved dependency
+        self._in_degree: Dict[str, int] = {}
+        self._dependents: Dict[str, Set[str]] = defaultdict(set)
+        self._blocked: Set[str] = set()
+
+        # Due dates not yet reached as a (due_date, task_id) min-heap; once
+        # due, unfinished tasks move to _overdue until they are DONE
+        self._due_heap: List[Tuple[datetime, str]] = []
+        self._overdue: Dict[str, None] = {}
+
+        # Task IDs that became startable, created by the first ready_stream()
+        self._ready_queue: Optional[asyncio.Queue] = None
+
+        # Running totals for get_analytics
+        self._priority_counts: Counter = Counter()
+        self._total_time = 0
+
+        # assignee -> their task IDs (dicts as insertion-ordered sets)
+        self._by_assignee: Dict[str, Dict[str, None]] = defaultdict(dict)
+
+        # Serialized tasks for export_board, rebuilt only for tasks touched
+        # since the last export
+        self._task_cache: Dict[str, Dict] = {}
+        self._dirty: Set[str] = set()
+
     def create_task(
         self,
         title: str,
@@ -114,6 +189,7 @@ class KanbanBoard:
         due_date: Optional[datetime] = None,
         estimated_minutes: int = 0,
         tags: Set[str] = None,
+        now: Optional[datetime] = None,
     ) -> str:
         """
         Create new task
@@ -127,11 +203,13 @@ class KanbanBoard:
             due_date: Optional due date
             estimated_minutes: Time estimate
             tags: Task tags
+            now: Creation time (defaults to the current time)
 
         Returns:
             Task ID
         """
-        task_id = str(uuid.uuid4())[:8]
+        task_id = uuid.uuid4().hex[:8]
+        now = now or datetime.now(timezone.utc)
 
         task = KanbanTask(
             id=task_id,
@@ -141,16 +219,38 @@ class KanbanBoard:
             priority=priority,
             assignee=assignee,
             created_by=created_by,
+            created_at=now,
+            updated_at=now,
             due_date=due_date,
             estimated_minutes=estimated_minutes,
             tags=tags or set(),
         )
 
         self.tasks[task_id] = task
-        self.columns[TaskStatus.TODO].tasks.append(task_id)
+        self.columns[TaskStatus.TODO].tasks[task_id] = None
+        if assignee:
+            self._by_assignee[assignee][task_id] = None
+        if due_date:
+            heapq.heappush(self._due_heap, (due_date, task_id))
+        self._priority_counts[priority] += 1
+        self._dirty.add(task_id)
+        self._mark_ready(task_id)
 
         return task_id
 
+    def import_bulk(self, task_specs: List[Dict]) -> List[str]:
+        """
+        Create many tasks at once, all stamped with the same creation time
+
+        Args:
+            task_specs: create_task keyword arguments, one dict per task
+
+        Returns:
+            Task IDs in the order given
+        """
+        now = datetime.now(timezone.utc)
+        return [self.create_task(**spec, now=now) for spec in task_specs]
+
     def move_task(
         self, task_id: str, new_status: TaskStatus, moved_by: str = ""
     ) -> bool:
@@ -172,7 +272,7 @@ class KanbanBoard:
         old_status = task.status
 
         # Check WIP limit
-        if new_status in [TaskStatus.IN_PROGRESS, TaskStatus.REVIEW]:
+        if new_status in (TaskStatus.IN_PROGRESS, TaskStatus.REVIEW):
             column = self.columns[new_status]
             if column.wip_limit and len(column.tasks) >= column.wip_limit:
                 raise Exception(
@@ -180,26 +280,37 @@ class KanbanBoard:
                 )
 
         # Check dependencies
-        if new_status == TaskStatus.IN_PROGRESS:
+        if new_status is TaskStatus.IN_PROGRESS:
             if not self._can_start_task(task_id):
                 raise Exception(f"Task blocked by dependencies: {task.dependencies}")
 
         # Remove from old column
-        if task_id in self.columns[old_status].tasks:
-            self.columns[old_status].tasks.remove(task_id)
+        self.columns[old_status].tasks.pop(task_id, None)
 
         # Add to new column
-        self.columns[new_status].tasks.append(task_id)
+        self.columns[new_status].tasks[task_id] = None
 
         # Update task
         task.status = new_status
-        task.updated_at = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
+
+        # Finishing (or reopening) a task unblocks (or re-blocks) its dependents
+        if (old_status is TaskStatus.DONE) != (new_status is TaskStatus.DONE):
+            resolved = new_status is TaskStatus.DONE
+            self._update_dependents(task_id, resolved=resolved)
+
+            # Done tasks are never overdue; reopened ones go back on the heap
+            if resolved:
+                self._overdue.pop(task_id, None)
+            elif task.due_date:
+                heapq.heappush(self._due_heap, (task.due_date, task_id))
 
-        # Add comment
-        self.add_comment(
-            task_id,
+        # Add comment (also bumps updated_at)
+        self._append_comment(
+            task,
             moved_by or "SYSTEM",
             f"Moved from {old_status.value} to {new_status.value}",
+            now,
         )
 
         return True
@@ -212,64 +323,143 @@ class KanbanBoard:
 
         old_assignee = task.assignee
         task.assignee = assignee
-        task.updated_at = datetime.now(timezone.utc)
 
-        self.add_comment(
-            task_id,
+        if old_assignee:
+            bucket = self._by_assignee[old_assignee]
+            bucket.pop(task_id, None)
+            if not bucket:
+                del self._by_assignee[old_assignee]
+        if assignee:
+            self._by_assignee[assignee][task_id] = None
+
+        self._append_comment(
+            task,
             "SYSTEM",
             f"Assigned to {assignee}"
             + (f" (was: {old_assignee})" if old_assignee else ""),
+            datetime.now(timezone.utc),
         )
 
         return True
 
     def add_dependency(self, task_id: str, depends_on: str) -> bool:
-        """Add task dependency"""
+        """Add task dependency (refused if it would create a cycle)"""
         task = self.tasks.get(task_id)
         if not task:
             return False
 
-        task.dependencies.add(depends_on)
-        task.updated_at = datetime.now(timezone.utc)
+        if depends_on not in task.dependencies:
+            if self._depends_on(depends_on, task_id):
+                return False
 
-        return True
+            task.dependencies.add(depends_on)
+            self._dependents[depends_on].add(task_id)
 
-    def _can_start_task(self, task_id: str) -> bool:
-        """Check if task can be started (all dependencies done)"""
-        task = self.tasks.get(task_id)
-        if not task:
-            return False
+            dep_task = self.tasks.get(depends_on)
+            if dep_task is None or dep_task.status is not TaskStatus.DONE:
+                self._in_degree[task_id] = self._in_degree.get(task_id, 0) + 1
+                self._blocked.add(task_id)
 
-        for dep_id in task.dependencies:
-            dep_task = self.tasks.get(dep_id)
-            if not dep_task or dep_task.status != TaskStatus.DONE:
-                return False
+        self._touch(task)
 
         return True
 
+    def _depends_on(self, task_id: str, target: str) -> bool:
+        """Check whether task_id is, or transitively depends on, target"""
+        # Walk from target to everything waiting on it, looking for task_id
+        stack = [target]
+        seen = {target}
+        while stack:
+            current = stack.pop()
+            if current == task_id:
+                return True
+            for dependent in self._dependents.get(current, ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    stack.append(dependent)
+        return False
+
+    def _update_dependents(self, task_id: str, resolved: bool):
+        """Adjust unresolved-dependency counts after task_id enters/leaves DONE"""
+        for dependent in self._dependents.get(task_id, ()):
+            if resolved:
+                remaining = self._in_degree[dependent] - 1
+                if remaining:
+                    self._in_degree[dependent] = remaining
+                else:
+                    del self._in_degree[dependent]
+                    self._blocked.discard(dependent)
+                    self._mark_ready(dependent)
+            else:
+                self._in_degree[dependent] = self._in_degree.get(dependent, 0) + 1
+                self._blocked.add(dependent)
+
+    def _mark_ready(self, task_id: str):
+        """Hand a newly startable task to ready_stream consumers"""
+        if self._ready_queue is not None:
+            self._ready_queue.put_nowait(task_id)
+
+    async def ready_stream(self) -> AsyncIterator[KanbanTask]:
+        """
+        Yield TODO tasks as soon as all their dependencies are DONE
+
+        Starts with the tasks that are ready now, then waits for tasks to be
+        unblocked or created. Several consumers share one queue, so each
+        ready task goes to one of them; consumers are expected to move the
+        tasks they take out of TODO.
+        """
+        if self._ready_queue is None:
+            self._ready_queue = asyncio.Queue()
+            for task_id in self.columns[TaskStatus.TODO].tasks:
+                if self._can_start_task(task_id):
+                    self._ready_queue.put_nowait(task_id)
+
+        while True:
+            task_id = await self._ready_queue.get()
+
+            # Skip tasks that were started, or re-blocked, since being queued
+            task = self.tasks.get(task_id)
+            if (
+                task
+                and task.status is TaskStatus.TODO
+                and self._can_start_task(task_id)
+            ):
+                yield task
+
+    def _can_start_task(self, task_id: str) -> bool:
+        """Check if task can be started (all dependencies done)"""
+        # _in_degree only holds tasks with unresolved dependencies
+        return task_id not in self._in_degree and task_id in self.tasks
+
     def add_comment(self, task_id: str, author: str, text: str):
         """Add comment to task"""
         task = self.tasks.get(task_id)
         if not task:
             return
 
+        self._append_comment(task, author, text, datetime.now(timezone.utc))
+
+    def _append_comment(self, task: KanbanTask, author: str, text: str, now: datetime):
+        """Append a comment stamped with now and bump updated_at to match"""
+        # Comment IDs only need to be unique within their task
         task.comments.append(
-            {
-                "id": str(uuid.uuid4())[:8],
-                "author": author,
-                "text": text,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
+            Comment(f"c{len(task.comments) + 1}", author, text, now.isoformat())
         )
 
-        task.updated_at = datetime.now(timezone.utc)
+        self._touch(task, now)
 
     def add_time(self, task_id: str, minutes: int):
         """Add time spent on task"""
         task = self.tasks.get(task_id)
         if task:
             task.time_spent_minutes += minutes
-            task.updated_at = datetime.now(timezone.utc)
+            self._total_time += minutes
+            self._touch(task)
+
+    def _touch(self, task: KanbanTask, now: Optional[datetime] = None):
+        """Bump updated_at and mark the task for re-serialization"""
+        task.updated_at = now or datetime.now(timezone.utc)
+        self._dirty.add(task.id)
 
     def get_task(self, task_id: str) -> Optional[KanbanTask]:
         """Get task by ID"""
@@ -277,30 +467,73 @@ class KanbanBoard:
 
     def get_tasks_by_status(self, status: TaskStatus) -> List[KanbanTask]:
         """Get all tasks in status"""
-        task_ids = self.columns[status].tasks
-        return [self.tasks[tid] for tid in task_ids if tid in self.tasks]
+        get = self.tasks.get
+        return [task for tid in self.columns[status].tasks if (task := get(tid))]
 
     def get_tasks_by_assignee(self, assignee: str) -> List[KanbanTask]:
         """Get all tasks assigned to member"""
-        return [t for t in self.tasks.values() if t.assignee == assignee]
+        tasks = self.tasks
+        return [tasks[tid] for tid in self._by_assignee.get(assignee, ())]
 
     def get_overdue_tasks(self) -> List[KanbanTask]:
-        """Get overdue tasks"""
+        """Get overdue tasks, ordered by when they became due"""
         now = datetime.now(timezone.utc)
-        return [
-            t
-            for t in self.tasks.values()
-            if t.due_date and t.due_date < now and t.status != TaskStatus.DONE
-        ]
+        heap = self._due_heap
+
+        # Only entries that fell due since the last call are popped; finished
+        # tasks and duplicate entries are skipped
+        while heap and heap[0][0] < now:
+            due_date, task_id = heapq.heappop(heap)
+            task = self.tasks.get(task_id)
+            if (
+                task
+                and task.status is not TaskStatus.DONE
+                and task.due_date == due_date
+            ):
+                self._overdue[task_id] = None
+
+        tasks = self.tasks
+        return [tasks[task_id] for task_id in self._overdue]
 
     def get_blocked_tasks(self) -> List[KanbanTask]:
         """Get tasks blocked by dependencies"""
-        blocked = []
-        for task in self.tasks.values():
-            if task.status == TaskStatus.TODO and task.dependencies:
-                if not self._can_start_task(task.id):
-                    blocked.append(task)
-        return blocked
+        tasks = self.tasks
+        todo = TaskStatus.TODO
+        return [
+            task for task_id in self._blocked if (task := tasks[task_id]).status is todo
+        ]
+
+    def get_execution_order(self) -> List[KanbanTask]:
+        """
+        Get tasks ordered so every task follows its unfinished dependencies
+
+        Tasks with nothing left to wait on come first, in creation order;
+        the rest follow as their dependencies are placed (Kahn's algorithm,
+        O(tasks + dependencies)). Tasks waiting on a missing task are left
+        out.
+        """
+        tasks = self.tasks
+        dependents = self._dependents
+        done = TaskStatus.DONE
+        remaining = dict(self._in_degree)
+        ready = deque(task_id for task_id in tasks if task_id not in remaining)
+        order = []
+
+        while ready:
+            task = tasks[ready.popleft()]
+            order.append(task)
+
+            # Dependencies that are already DONE were never counted
+            if task.status is done:
+                continue
+
+            for dependent in dependents.get(task.id, ()):
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    del remaining[dependent]
+                    ready.append(dependent)
+
+        return order
 
     def get_analytics(self) -> Dict:
         """Get board analytics"""
@@ -317,36 +550,25 @@ class KanbanBoard:
                 "total_time_spent": 0,
             }
 
-        # Count by status (only for columns that exist)
-        by_status = {}
-        for status in TaskStatus:
-            if status in self.columns:
-                by_status[status.value] = len(self.get_tasks_by_status(status))
-            else:
-                # Count tasks with this status that aren't in columns
-                by_status[status.value] = sum(
-                    1 for t in self.tasks.values() if t.status == status
-                )
-
-        # Count by priority
-        by_priority = {}
-        for priority in TaskPriority:
-            by_priority[priority.value] = sum(
-                1 for t in self.tasks.values() if t.priority == priority
-            )
+        # Priority counts and total time are kept up to date as tasks change
+        priority_counts = self._priority_counts
+        by_priority = {value: priority_counts[p] for p, value in _PRIORITY_VALUES}
+        total_time = self._total_time
 
-        # Count by assignee
-        by_assignee = {}
-        for task in self.tasks.values():
-            if task.assignee:
-                by_assignee[task.assignee] = by_assignee.get(task.assignee, 0) + 1
+        # Every status has a column holding its tasks
+        columns = self.columns
+        by_status = {
+            value: len(columns[status].tasks) for status, value in _STATUS_VALUES
+        }
+        by_assignee = {
+            assignee: len(task_ids) for assignee, task_ids in self._by_assignee.items()
+        }
 
         # Completion rate
-        done_count = by_status.get(TaskStatus.DONE.value, 0)
+        done_count = by_status.get(_DONE_VALUE, 0)
         completion_rate = (done_count / total_tasks * 100) if total_tasks > 0 else 0
 
         # Time tracking
-        total_time = sum(t.time_spent_minutes for t in self.tasks.values())
         avg_time = total_time / total_tasks if total_tasks > 0 else 0
 
         # Overdue
@@ -368,27 +590,69 @@ class KanbanBoard:
 
     def export_board(self) -> Dict:
         """Export board to JSON"""
+        # Callers own the result, so hand out copies of the cached tasks
+        return self._board_dict([self._copy_task(t) for t in self._export_tasks()])
+
+    def export_board_bytes(self) -> bytes:
+        """Export board as UTF-8 JSON (orjson when installed)"""
+        # Serialized straight away, so the cached task dicts can be shared
+        board = self._board_dict(self._export_tasks())
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(board)
+
+        import json
+
+        return json.dumps(board, separators=(",", ":")).encode()
+
+    def _board_dict(self, tasks: List[Dict]) -> Dict:
+        """Board export around already-serialized tasks"""
         return {
             "board_id": self.board_id,
             "name": self.name,
             "created_at": self.created_at.isoformat(),
             "members": list(self.members),
-            "tasks": [
-                {
-                    **asdict(task),
-                    "created_at": task.created_at.isoformat(),
-                    "updated_at": task.updated_at.isoformat(),
-                    "due_date": task.due_date.isoformat() if task.due_date else None,
-                    "status": task.status.value,
-                    "priority": task.priority.value,
-                    "tags": list(task.tags),
-                    "dependencies": list(task.dependencies),
-                }
-                for task in self.tasks.values()
-            ],
+            "tasks": tasks,
             "analytics": self.get_analytics(),
         }
 
+    def _export_tasks(self) -> List[Dict]:
+        """Serialized tasks, reusing cached dicts for untouched tasks"""
+        cache = self._task_cache
+        for task_id in self._dirty:
+            task = self.tasks.get(task_id)
+            if task:
+                cache[task_id] = self._export_task(task)
+        self._dirty.clear()
+
+        return [cache[task_id] for task_id in self.tasks]
+
+    @staticmethod
+    def _copy_task(exported: Dict) -> Dict:
+        """Copy of a cached task dict that shares nothing mutable with it"""
+        return {
+            **exported,
+            "tags": list(exported["tags"]),
+            "dependencies": list(exported["dependencies"]),
+            "subtasks": list(exported["subtasks"]),
+            "comments": [dict(comment) for comment in exported["comments"]],
+        }
+
+    @classmethod
+    def _export_task(cls, task: KanbanTask) -> Dict:
+        """Serialize one task for export_board (shallow, unlike asdict)"""
+        return {
+            **{name: getattr(task, name) for name in cls._EXPORT_FIELDS},
+            "created_at": task.created_at.isoformat(),
+            "updated_at": task.updated_at.isoformat(),
+            "due_date": task.due_date.isoformat() if task.due_date else None,
+            "status": task.status.value,
+            "priority": task.priority.value,
+            "tags": list(task.tags),
+            "dependencies": list(task.dependencies),
+            "subtasks": list(task.subtasks),
+            "comments": [comment._asdict() for comment in task.comments],
+        }
+
 
 class KanbanBoardManager:
     """Manage multiple kanban boards"""
@@ -398,7 +662,7 @@ class KanbanBoardManager:
 
     def create_board(self, name: str) -> str:
         """Create new board"""
-        board_id = str(uuid.uuid4())[:8]
+        board_id = uuid.uuid4().hex[:8]
         board = KanbanBoard(board_id, name)
         self.boards[board_id] = board
         return board_id
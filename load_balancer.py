@@ -4,13 +4,27 @@ Intelligent Load Balancer
 Distribute messages across multiple clients for optimal throughput
 """
 import time
-from typing import Dict, List, Optional
-from collections import defaultdict, deque
-from dataclasses import dataclass, field
+import bisect
+import hashlib
+import heapq
+import itertools
+from typing import Container, Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 import random
 
+# Smoothing factor for the average-latency EWMA
+LATENCY_ALPHA = 0.3
+
+# Points per unit of weight on the sticky-session hash ring
+RING_VNODES = 100
+
+
+def _ring_hash(key: str) -> int:
+    """Stable 64-bit hash for ring placement (hash() is salted per process)"""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
 
 class LoadStrategy(Enum):
     """Load balancing strategies"""
@@ -23,7 +37,7 @@ class LoadStrategy(Enum):
     STICKY_SESSION = "sticky_session"
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientMetrics:
     """Metrics for a client"""
 
@@ -35,10 +49,69 @@ class ClientMetrics:
     success_rate: float = 1.0
     failures: int = 0
     weight: float = 1.0
-    last_used: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    last_used: int = 0  # time.time_ns() of the last recorded result, 0 if none
     healthy: bool = True
 
 
+class _LazyHeap:
+    """
+    Min-heap of client IDs keyed by a metric, updated lazily
+
+    Updates push a new entry instead of re-sifting the old one; entries
+    superseded by a later update are dropped when they reach the top.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, str]] = []
+        self._latest: Dict[str, Tuple[int, float]] = {}  # client -> (seq, key)
+        self._seq = itertools.count()
+
+    def update(self, client_id: str, key: float):
+        """Set the key for a client"""
+        seq = next(self._seq)
+        self._latest[client_id] = (seq, key)
+        heapq.heappush(self._heap, (key, seq, client_id))
+
+        # Rebuild once stale entries outnumber live ones
+        if len(self._heap) > 2 * len(self._latest) + 16:
+            self._heap = [(key, seq, cid) for cid, (seq, key) in self._latest.items()]
+            heapq.heapify(self._heap)
+
+    def remove(self, client_id: str):
+        """Forget a client (its entries become stale)"""
+        self._latest.pop(client_id, None)
+
+    def min(self, allowed: Container[str]) -> Optional[str]:
+        """Client with the smallest key among allowed, or None"""
+        heap = self._heap
+        latest = self._latest
+
+        # Stale entries at the top are dropped for good
+        while heap:
+            key, seq, client_id = heap[0]
+            current = latest.get(client_id)
+            if current is not None and current[0] == seq:
+                break
+            heapq.heappop(heap)
+        else:
+            return None
+        if client_id in allowed:
+            return client_id
+
+        # Top client excluded for this call: walk the heap in key order
+        # from the root without popping, so the heap itself is untouched
+        frontier = [(heap[0], 0)]
+        while frontier:
+            (key, seq, client_id), index = heapq.heappop(frontier)
+            current = latest.get(client_id)
+            if current is not None and current[0] == seq and client_id in allowed:
+                return client_id
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return None
+
+
 class LoadBalancer:
     """
     Intelligent load balancer for message distribution
@@ -52,14 +125,48 @@ class LoadBalancer:
     - Circuit breaker integration
     """
 
-    def __init__(self, strategy: LoadStrategy = LoadStrategy.LEAST_LOADED):
+    def __init__(
+        self,
+        strategy: LoadStrategy = LoadStrategy.LEAST_LOADED,
+        seed: Optional[int] = None,
+    ):
         self.strategy = strategy
+        # Own RNG: avoids the shared module-level one, and seedable for tests
+        self._rng = random.Random(seed)
+
+        # Strategy -> selection method, one dict lookup per routed message
+        self._strategies = {
+            LoadStrategy.ROUND_ROBIN: self._round_robin,
+            LoadStrategy.LEAST_LOADED: self._least_loaded,
+            LoadStrategy.FASTEST_RESPONSE: self._fastest_response,
+            LoadStrategy.RANDOM: self._random,
+            LoadStrategy.WEIGHTED: self._weighted_random,
+            LoadStrategy.STICKY_SESSION: self._first,
+        }
         self.clients: Dict[str, ClientMetrics] = {}
         self.round_robin_index = 0
-        self.sessions: Dict[str, str] = {}  # session_id -> client_id
-        self.latency_window = deque(maxlen=100)  # Rolling window
+        # Consistent-hash ring for sticky sessions: sorted point hashes and
+        # the client owning each point. Rebuilt on the first sticky lookup
+        # after clients join or leave, so registration stays O(1)
+        self._ring_hashes: List[int] = []
+        self._ring_clients: List[str] = []
+        self._ring_dirty = False
         self.stats = {"total_routed": 0, "failovers": 0, "strategy_changes": 0}
 
+        # Healthy client IDs (a dict as an insertion-ordered set), plus a
+        # tuple of them for index-based strategies, rebuilt after changes
+        self._healthy: Dict[str, None] = {}
+        self._healthy_ids: Optional[Tuple[str, ...]] = None
+        self._healthy_cum_weights: Optional[List[float]] = None
+
+        # Running totals over all clients for get_stats
+        self._pending_total = 0
+        self._success_rate_sum = 0.0
+
+        # Clients ordered by pending messages / average latency
+        self._load_heap = _LazyHeap()
+        self._latency_heap = _LazyHeap()
+
     def register_client(self, client_id: str, weight: float = 1.0):
         """
         Register a client for load balancing
@@ -69,26 +176,77 @@ class LoadBalancer:
             weight: Weight for weighted strategies (higher = more traffic)
         """
         if client_id not in self.clients:
-            self.clients[client_id] = ClientMetrics(client_id=client_id, weight=weight)
+            metrics = ClientMetrics(client_id=client_id, weight=weight)
+            self.clients[client_id] = metrics
+            self._success_rate_sum += metrics.success_rate
+            self._set_healthy(client_id, True)
+            self._ring_dirty = True
 
     def unregister_client(self, client_id: str):
         """Unregister a client"""
         if client_id in self.clients:
-            del self.clients[client_id]
+            metrics = self.clients.pop(client_id)
+            self._pending_total -= metrics.pending_messages
+            self._success_rate_sum -= metrics.success_rate
+            self._set_healthy(client_id, False)
+            self._ring_dirty = True
 
     def mark_unhealthy(self, client_id: str):
         """Mark client as unhealthy"""
         if client_id in self.clients:
             self.clients[client_id].healthy = False
+            self._set_healthy(client_id, False)
 
     def mark_healthy(self, client_id: str):
         """Mark client as healthy"""
         if client_id in self.clients:
             self.clients[client_id].healthy = True
+            self._set_healthy(client_id, True)
+
+    def _set_healthy(self, client_id: str, healthy: bool):
+        """Add / remove a client from the healthy set and metric heaps"""
+        if healthy == (client_id in self._healthy):
+            return
+        # Unhealthy clients stay out of the heaps until they recover, so
+        # selection never has to step over them
+        if healthy:
+            self._healthy[client_id] = None
+            metrics = self.clients[client_id]
+            self._load_heap.update(client_id, metrics.pending_messages)
+            self._latency_heap.update(client_id, metrics.avg_latency_ms)
+        else:
+            del self._healthy[client_id]
+            self._load_heap.remove(client_id)
+            self._latency_heap.remove(client_id)
+        self._healthy_ids = None
+        self._healthy_cum_weights = None
+
+    def _rebuild_ring(self):
+        """Place every registered client on the hash ring, weighted"""
+        points = sorted(
+            (_ring_hash(f"{client_id}#{i}"), client_id)
+            for client_id, metrics in self.clients.items()
+            for i in range(max(1, int(RING_VNODES * metrics.weight)))
+        )
+        self._ring_hashes = [point for point, _ in points]
+        self._ring_clients = [client_id for _, client_id in points]
+
+    def _ring_lookup(self, session_id: str, available: Dict[str, None]) -> str:
+        """First available client clockwise from the session's ring position"""
+        if self._ring_dirty:
+            self._rebuild_ring()
+            self._ring_dirty = False
+        clients = self._ring_clients
+        start = bisect.bisect_left(self._ring_hashes, _ring_hash(session_id))
+        for i in range(len(clients)):
+            client_id = clients[(start + i) % len(clients)]
+            if client_id in available:
+                return client_id
+        return next(iter(available))
 
     def get_healthy_clients(self) -> List[str]:
         """Get list of healthy clients"""
-        return [cid for cid, metrics in self.clients.items() if metrics.healthy]
+        return list(self._healthy)
 
     def select_client(
         self, session_id: Optional[str] = None, excluded: Optional[List[str]] = None
@@ -103,74 +261,84 @@ class LoadBalancer:
         Returns:
             Selected client ID or None
         """
-        excluded = excluded or []
-        available = [cid for cid in self.get_healthy_clients() if cid not in excluded]
+        if excluded:
+            excluded = set(excluded)
+            available = {cid: None for cid in self._healthy if cid not in excluded}
+        else:
+            available = self._healthy
 
         if not available:
             return None
 
         self.stats["total_routed"] += 1
 
-        # Sticky session
+        # Sticky session: unhealthy or excluded clients only move their own
+        # sessions, to the next client on the ring
         if session_id and self.strategy == LoadStrategy.STICKY_SESSION:
-            if session_id in self.sessions:
-                client = self.sessions[session_id]
-                if client in available:
-                    return client
-
-            # Assign new sticky client
-            client = self._select_by_strategy(available)
-            self.sessions[session_id] = client
-            return client
+            return self._ring_lookup(session_id, available)
 
         return self._select_by_strategy(available)
 
-    def _select_by_strategy(self, available: List[str]) -> str:
+    def _select_by_strategy(self, available: Dict[str, None]) -> str:
         """
         Select client using configured strategy
 
         Args:
-            available: List of available clients
+            available: Available clients (ordered set)
 
         Returns:
             Selected client ID
         """
-        if self.strategy == LoadStrategy.ROUND_ROBIN:
-            return self._round_robin(available)
-
-        elif self.strategy == LoadStrategy.LEAST_LOADED:
-            return self._least_loaded(available)
-
-        elif self.strategy == LoadStrategy.FASTEST_RESPONSE:
-            return self._fastest_response(available)
-
-        elif self.strategy == LoadStrategy.RANDOM:
-            return random.choice(available)
-
-        elif self.strategy == LoadStrategy.WEIGHTED:
-            return self._weighted_random(available)
-
-        else:
-            return available[0]
-
-    def _round_robin(self, available: List[str]) -> str:
+        return self._strategies[self.strategy](available)
+
+    def _random(self, available: Dict[str, None]) -> str:
+        """Uniform random selection"""
+        return self._rng.choice(self._ordered(available))
+
+    @staticmethod
+    def _first(available: Dict[str, None]) -> str:
+        """First available client (sticky sessions without a session ID)"""
+        return next(iter(available))
+
+    def _ordered(self, available: Dict[str, None]) -> Tuple[str, ...]:
+        """Available clients as a tuple, cached when they're all healthy ones"""
+        if available is not self._healthy:
+            return tuple(available)
+        if self._healthy_ids is None:
+            self._healthy_ids = tuple(available)
+        return self._healthy_ids
+
+    def _round_robin(self, available: Dict[str, None]) -> str:
         """Round-robin selection"""
-        client = available[self.round_robin_index % len(available)]
+        ordered = self._ordered(available)
+        client = ordered[self.round_robin_index % len(ordered)]
         self.round_robin_index += 1
         return client
 
-    def _least_loaded(self, available: List[str]) -> str:
+    def _least_loaded(self, available: Dict[str, None]) -> str:
         """Select client with fewest pending messages"""
-        return min(available, key=lambda cid: self.clients[cid].pending_messages)
+        return self._load_heap.min(available)
 
-    def _fastest_response(self, available: List[str]) -> str:
+    def _fastest_response(self, available: Dict[str, None]) -> str:
         """Select client with lowest average latency"""
-        return min(available, key=lambda cid: self.clients[cid].avg_latency_ms)
+        return self._latency_heap.min(available)
 
-    def _weighted_random(self, available: List[str]) -> str:
+    def _weighted_random(self, available: Dict[str, None]) -> str:
         """Weighted random selection"""
-        weights = [self.clients[cid].weight for cid in available]
-        return random.choices(available, weights=weights)[0]
+        ordered = self._ordered(available)
+
+        # Weights only change with the healthy set, so cache their running sum
+        if available is self._healthy and self._healthy_cum_weights is not None:
+            cum_weights = self._healthy_cum_weights
+        else:
+            cum_weights = list(
+                itertools.accumulate(self.clients[cid].weight for cid in ordered)
+            )
+            if available is self._healthy:
+                self._healthy_cum_weights = cum_weights
+
+        index = bisect.bisect_right(cum_weights, self._rng.random() * cum_weights[-1])
+        return ordered[index]
 
     def record_latency(self, client_id: str, latency_ms: float):
         """
@@ -187,15 +355,55 @@ class LoadBalancer:
 
         # Update last latency
         metrics.last_latency_ms = latency_ms
+        metrics.last_used = time.time_ns()
 
         # Update average (exponential moving average)
-        alpha = 0.3  # Smoothing factor
         if metrics.avg_latency_ms == 0:
             metrics.avg_latency_ms = latency_ms
         else:
             metrics.avg_latency_ms = (
-                alpha * latency_ms + (1 - alpha) * metrics.avg_latency_ms
+                LATENCY_ALPHA * latency_ms
+                + (1 - LATENCY_ALPHA) * metrics.avg_latency_ms
+            )
+
+        if client_id in self._healthy:
+            self._latency_heap.update(client_id, metrics.avg_latency_ms)
+
+    def record_latencies(self, samples: Iterable[Tuple[str, float]]):
+        """
+        Record a batch of latencies
+
+        Same result as calling record_latency per sample, but each client's
+        average and heap entry is written once per batch.
+
+        Args:
+            samples: (client_id, latency_ms) pairs in arrival order
+        """
+        averages: Dict[str, float] = {}
+        last: Dict[str, float] = {}
+
+        for client_id, latency_ms in samples:
+            if client_id not in self.clients:
+                continue
+
+            avg = averages.get(client_id)
+            if avg is None:
+                avg = self.clients[client_id].avg_latency_ms
+            averages[client_id] = (
+                latency_ms
+                if avg == 0
+                else LATENCY_ALPHA * latency_ms + (1 - LATENCY_ALPHA) * avg
             )
+            last[client_id] = latency_ms
+
+        now = time.time_ns()
+        for client_id, avg in averages.items():
+            metrics = self.clients[client_id]
+            metrics.avg_latency_ms = avg
+            metrics.last_latency_ms = last[client_id]
+            metrics.last_used = now
+            if client_id in self._healthy:
+                self._latency_heap.update(client_id, avg)
 
     def record_success(self, client_id: str):
         """Record successful message delivery"""
@@ -204,10 +412,13 @@ class LoadBalancer:
 
         metrics = self.clients[client_id]
         metrics.total_messages += 1
+        metrics.last_used = time.time_ns()
 
         # Update success rate (exponential moving average)
         alpha = 0.1
-        metrics.success_rate = alpha * 1.0 + (1 - alpha) * metrics.success_rate
+        old_rate = metrics.success_rate
+        metrics.success_rate = alpha * 1.0 + (1 - alpha) * old_rate
+        self._success_rate_sum += metrics.success_rate - old_rate
 
     def record_failure(self, client_id: str):
         """Record failed message delivery"""
@@ -219,7 +430,9 @@ class LoadBalancer:
 
         # Update success rate
         alpha = 0.1
-        metrics.success_rate = alpha * 0.0 + (1 - alpha) * metrics.success_rate
+        old_rate = metrics.success_rate
+        metrics.success_rate = alpha * 0.0 + (1 - alpha) * old_rate
+        self._success_rate_sum += metrics.success_rate - old_rate
 
         # Mark unhealthy if too many failures
         if metrics.success_rate < 0.5:
@@ -228,13 +441,21 @@ class LoadBalancer:
     def increment_pending(self, client_id: str):
         """Increment pending message count"""
         if client_id in self.clients:
-            self.clients[client_id].pending_messages += 1
+            metrics = self.clients[client_id]
+            metrics.pending_messages += 1
+            self._pending_total += 1
+            if client_id in self._healthy:
+                self._load_heap.update(client_id, metrics.pending_messages)
 
     def decrement_pending(self, client_id: str):
         """Decrement pending message count"""
         if client_id in self.clients:
             metrics = self.clients[client_id]
-            metrics.pending_messages = max(0, metrics.pending_messages - 1)
+            if metrics.pending_messages > 0:
+                metrics.pending_messages -= 1
+                self._pending_total -= 1
+            if client_id in self._healthy:
+                self._load_heap.update(client_id, metrics.pending_messages)
 
     def failover(
         self, failed_client: str, session_id: Optional[str] = None
@@ -253,13 +474,7 @@ class LoadBalancer:
         self.mark_unhealthy(failed_client)
 
         # Select new client (excluding failed)
-        new_client = self.select_client(session_id=session_id, excluded=[failed_client])
-
-        # Update sticky session
-        if session_id and new_client:
-            self.sessions[session_id] = new_client
-
-        return new_client
+        return self.select_client(session_id=session_id, excluded=[failed_client])
 
     def change_strategy(self, strategy: LoadStrategy):
         """
@@ -288,7 +503,13 @@ class LoadBalancer:
             "failures": metrics.failures,
             "weight": metrics.weight,
             "healthy": metrics.healthy,
-            "last_used": metrics.last_used.isoformat(),
+            "last_used": (
+                datetime.fromtimestamp(
+                    metrics.last_used / 1e9, tz=timezone.utc
+                ).isoformat()
+                if metrics.last_used
+                else None
+            ),
         }
 
     def get_stats(self) -> Dict:
@@ -297,12 +518,10 @@ class LoadBalancer:
             **self.stats,
             "strategy": self.strategy.value,
             "registered_clients": len(self.clients),
-            "healthy_clients": len(self.get_healthy_clients()),
-            "total_pending": sum(c.pending_messages for c in self.clients.values()),
+            "healthy_clients": len(self._healthy),
+            "total_pending": self._pending_total,
             "avg_success_rate": (
-                sum(c.success_rate for c in self.clients.values()) / len(self.clients)
-                if self.clients
-                else 0
+                self._success_rate_sum / len(self.clients) if self.clients else 0
             ),
         }
 
@@ -20,8 +20,10 @@ Or via uvx (no install):
   uvx --from claude-multi-agent-bridge bridge-mcp
 """
 
+import asyncio
 import json
 import os
+import random
 import sys
 import queue
 import threading
@@ -29,6 +31,7 @@ import time
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 try:
     from mcp.server import Server
@@ -40,15 +43,24 @@ except ImportError:
 
 BRIDGE_URL = os.environ.get("BRIDGE_URL", "http://localhost:5001")
 DEFAULT_TIMEOUT = int(os.environ.get("BRIDGE_TIMEOUT", "30"))
+POLL_MIN_DELAY = 0.05  # seconds between reply polls, doubling up to the max
+POLL_MAX_DELAY = 0.5
 
 server = Server("claude-bridge")
 
+# One keep-alive pool for every bridge call, so bridge_ask's reply polling
+# doesn't open a new connection per request
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+SESSION = requests.Session()
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 
 def _send(to: str, msg_type: str, payload: dict, from_c: str = "mcp") -> dict:
-    resp = requests.post(
+    resp = SESSION.post(
         f"{BRIDGE_URL}/api/send",
         json={"from": from_c, "to": to, "type": msg_type, "payload": payload},
         timeout=5,
@@ -57,25 +69,56 @@ def _send(to: str, msg_type: str, payload: dict, from_c: str = "mcp") -> dict:
     return resp.json()
 
 
-def _wait_for_reply(msg_id: str, timeout: int = DEFAULT_TIMEOUT) -> dict | None:
+def _wait_for_reply(
+    msg_id: str, timeout: int = DEFAULT_TIMEOUT, sent_seq: int = 0
+) -> dict | None:
     """
-    Poll /api/messages until we see a reply referencing msg_id,
-    or until timeout. Returns the reply message or None.
+    Long-poll /api/messages/wait until the bridge hands back a reply
+    referencing msg_id, or until timeout. Returns the reply message or None.
+    Request errors are retried until the deadline. Falls back to polling
+    /api/messages after sent_seq (the request's own seq) on servers
+    without the endpoint.
     """
     deadline = time.time() + timeout
-    seen: set[str] = set()
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return None
+        try:
+            resp = SESSION.get(
+                f"{BRIDGE_URL}/api/messages/wait",
+                params={"reply_to": msg_id, "timeout": remaining},
+                timeout=remaining + 2,
+            )
+            if resp.status_code == 404:
+                return _poll_for_reply(msg_id, deadline, sent_seq)
+            resp.raise_for_status()
+            reply = resp.json().get("message")
+        except (requests.RequestException, ValueError):
+            # Transient bridge error — keep waiting until the deadline
+            time.sleep(min(POLL_MAX_DELAY, max(0.0, deadline - time.time())))
+            continue
+        if reply:
+            return reply
+
+
+def _poll_for_reply(msg_id: str, deadline: float, after_seq: int = 0) -> dict | None:
+    """
+    Poll /api/messages for a reply referencing msg_id until deadline,
+    backing off from 50ms to 500ms between polls.
+    """
+    last_seq = after_seq  # Replies can only come after the request
+    delay = POLL_MIN_DELAY
     while time.time() < deadline:
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"{BRIDGE_URL}/api/messages",
-                params={"to": "mcp"},
+                params={"to": "mcp", "after_seq": last_seq},
                 timeout=5,
             )
             messages = resp.json().get("messages", [])
             for m in messages:
-                if m["id"] in seen:
-                    continue
-                seen.add(m["id"])
+                last_seq = max(last_seq, m.get("seq") or 0)
                 payload = m.get("payload", {})
                 if (
                     payload.get("reply_to") == msg_id
@@ -84,7 +127,8 @@ def _wait_for_reply(msg_id: str, timeout: int = DEFAULT_TIMEOUT) -> dict | None:
                     return m
         except Exception:
             pass
-        time.sleep(0.5)
+        time.sleep(delay * random.uniform(0.5, 1.0))
+        delay = min(POLL_MAX_DELAY, delay * 2)
     return None
 
 
@@ -210,7 +254,8 @@ async def list_tools() -> list[types.Tool]:
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
     try:
         if name == "bridge_send":
-            result = _send(
+            result = await asyncio.to_thread(
+                _send,
                 to=arguments["to"],
                 msg_type=arguments.get("type", "message"),
                 payload={"text": arguments["message"]},
@@ -223,7 +268,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             ]
 
         elif name == "bridge_ask":
-            sent = _send(
+            sent = await asyncio.to_thread(
+                _send,
                 to=arguments["to"],
                 msg_type="request",
                 payload={
@@ -234,7 +280,9 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             )
             msg_id = sent.get("message_id")
             timeout = arguments.get("timeout", DEFAULT_TIMEOUT)
-            reply = _wait_for_reply(msg_id, timeout=timeout)
+            reply = await asyncio.to_thread(
+                _wait_for_reply, msg_id, timeout, sent.get("seq") or 0
+            )
             if reply:
                 payload = reply.get("payload", {})
                 text = (
@@ -253,7 +301,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
                 ]
 
         elif name == "bridge_broadcast":
-            result = _send(
+            result = await asyncio.to_thread(
+                _send,
                 to="all",
                 msg_type=arguments.get("type", "broadcast"),
                 payload={"text": arguments["message"]},
@@ -269,7 +318,9 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             params = {}
             if arguments.get("since"):
                 params["since"] = arguments["since"]
-            resp = requests.get(f"{BRIDGE_URL}/api/messages", params=params, timeout=5)
+            resp = await asyncio.to_thread(
+                SESSION.get, f"{BRIDGE_URL}/api/messages", params=params, timeout=5
+            )
             messages = resp.json().get("messages", [])
             limit = arguments.get("limit", 20)
             messages = messages[-limit:]
@@ -286,7 +337,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             return [types.TextContent(type="text", text="\n".join(lines))]
 
         elif name == "bridge_search":
-            resp = requests.get(
+            resp = await asyncio.to_thread(
+                SESSION.get,
                 f"{BRIDGE_URL}/api/search",
                 params={"q": arguments["query"], "limit": arguments.get("limit", 10)},
                 timeout=5,
@@ -309,7 +361,9 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             return [types.TextContent(type="text", text="\n".join(lines))]
 
         elif name == "bridge_status":
-            resp = requests.get(f"{BRIDGE_URL}/api/status", timeout=5)
+            resp = await asyncio.to_thread(
+                SESSION.get, f"{BRIDGE_URL}/api/status", timeout=5
+            )
             data = resp.json()
             return [types.TextContent(type="text", text=json.dumps(data, indent=2))]
 
@@ -339,6 +393,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-
-    asyncio.run(main())
+    try:
+        import uvloop  # faster event loop (not on Windows)
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -3,10 +3,10 @@
 Message Acknowledgment System
 Ensures reliable message delivery with retry logic
 """
+import heapq
 import time
 import threading
-from typing import Dict, Optional, Callable, Set
-from datetime import datetime, timezone
+from typing import Dict, List, Optional, Callable, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import uuid
@@ -40,6 +40,9 @@ class AckMessage:
         acked_at: Time acknowledged
         retries: Number of retry attempts
         timeout: Timeout in seconds
+        created_at: Time created
+
+    Times are time.monotonic() seconds.
     """
 
     id: str
@@ -48,12 +51,12 @@ class AckMessage:
     type: str
     payload: Dict
     status: MessageStatus = MessageStatus.PENDING
-    sent_at: Optional[datetime] = None
-    delivered_at: Optional[datetime] = None
-    acked_at: Optional[datetime] = None
+    sent_at: Optional[float] = None
+    delivered_at: Optional[float] = None
+    acked_at: Optional[float] = None
     retries: int = 0
     timeout: int = 30
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: float = field(default_factory=time.monotonic)
 
 
 class AckManager:
@@ -93,6 +96,9 @@ class AckManager:
             "total_failed": 0,
             "total_timeout": 0,
         }
+        # (deadline, msg_id) min-heap; the worker sleeps until the earliest
+        self._deadlines: List[Tuple[float, str]] = []
+        self._wakeup = threading.Condition()
         self._running = False
         self._retry_thread = None
 
@@ -118,6 +124,7 @@ class AckManager:
             Message ID
         """
         msg_id = str(uuid.uuid4())
+        now = time.monotonic()
 
         message = AckMessage(
             id=msg_id,
@@ -126,7 +133,8 @@ class AckManager:
             type=msg_type,
             payload=payload,
             timeout=timeout,
-            sent_at=datetime.now(timezone.utc),
+            sent_at=now,
+            created_at=now,
         )
 
         message.status = MessageStatus.SENT
@@ -135,6 +143,10 @@ class AckManager:
         self.pending_acks.add(msg_id)
         self.stats["total_sent"] += 1
 
+        with self._wakeup:
+            heapq.heappush(self._deadlines, (now + timeout, msg_id))
+            self._wakeup.notify()
+
         return msg_id
 
     def mark_delivered(self, msg_id: str) -> bool:
@@ -152,7 +164,7 @@ class AckManager:
 
         message = self.messages[msg_id]
         message.status = MessageStatus.DELIVERED
-        message.delivered_at = datetime.now(timezone.utc)
+        message.delivered_at = time.monotonic()
 
         self.stats["total_delivered"] += 1
 
@@ -176,7 +188,7 @@ class AckManager:
 
         message = self.messages[msg_id]
         message.status = MessageStatus.ACKNOWLEDGED
-        message.acked_at = datetime.now(timezone.utc)
+        message.acked_at = time.monotonic()
 
         # Remove from pending
         self.pending_acks.discard(msg_id)
@@ -253,43 +265,55 @@ class AckManager:
         self._running = True
 
         def worker():
+            next_retry = time.monotonic()
             while self._running:
                 try:
                     self._check_timeouts()
-                    self._retry_pending()
+                    if time.monotonic() >= next_retry:
+                        self._retry_pending()
+                        next_retry = time.monotonic() + self.retry_delay
                 except Exception as e:
                     print(f"❌ Retry worker error: {e}")
 
-                time.sleep(self.retry_delay)
+                # Sleep until the next retry round or the earliest deadline,
+                # whichever comes first; new sends and stop() wake us early
+                with self._wakeup:
+                    wake_at = next_retry
+                    if self._deadlines:
+                        wake_at = min(wake_at, self._deadlines[0][0])
+                    if self._running:
+                        self._wakeup.wait(max(0.0, wake_at - time.monotonic()))
 
         self._retry_thread = threading.Thread(target=worker, daemon=True)
         self._retry_thread.start()
 
     def stop_retry_worker(self):
         """Stop retry worker"""
-        self._running = False
+        with self._wakeup:
+            self._running = False
+            self._wakeup.notify_all()
 
     def _check_timeouts(self):
-        """Check for timed-out messages"""
-        now = datetime.now(timezone.utc)
+        """Time out pending messages whose deadline has passed"""
+        now = time.monotonic()
+        expired = []
 
-        for msg_id in list(self.pending_acks):
+        with self._wakeup:
+            while self._deadlines and self._deadlines[0][0] < now:
+                expired.append(heapq.heappop(self._deadlines)[1])
+
+        for msg_id in expired:
+            # Acked / failed / cleaned-up messages just leave their entry behind
             message = self.messages.get(msg_id)
-            if not message:
+            if not message or msg_id not in self.pending_acks:
                 continue
 
-            # Check timeout
-            if message.sent_at:
-                elapsed = (now - message.sent_at).total_seconds()
-
-                if elapsed > message.timeout:
-                    # Timeout
-                    message.status = MessageStatus.TIMEOUT
-                    self.pending_acks.discard(msg_id)
-                    self.stats["total_timeout"] += 1
+            message.status = MessageStatus.TIMEOUT
+            self.pending_acks.discard(msg_id)
+            self.stats["total_timeout"] += 1
 
-                    # Trigger callbacks
-                    self._trigger_callbacks("on_timeout", message)
+            # Trigger callbacks
+            self._trigger_callbacks("on_timeout", message)
 
     def _retry_pending(self):
         """Retry pending messages"""
@@ -335,8 +359,7 @@ class AckManager:
         Args:
             max_age_seconds: Max age to keep (default: 1 hour)
         """
-        now = datetime.now(timezone.utc)
-        cutoff = now.timestamp() - max_age_seconds
+        cutoff = time.monotonic() - max_age_seconds
 
         to_remove = []
 
@@ -347,7 +370,7 @@ class AckManager:
                 MessageStatus.FAILED,
                 MessageStatus.TIMEOUT,
             ]:
-                if message.created_at.timestamp() < cutoff:
+                if message.created_at < cutoff:
                     to_remove.append(msg_id)
 
         for msg_id in to_remove:
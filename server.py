@@ -11,6 +11,7 @@ Phase 1 upgrades:
 """
 
 import json
+import math
 import queue
 import sqlite3
 import threading
@@ -31,6 +32,12 @@ db_local = threading.local()
 _subscribers: dict[str, list[queue.Queue]] = {}  # client_id -> [Queue, ...]
 _subscribers_lock = threading.Lock()
 
+# Long-poll reply waiters — /api/messages/wait blocks until a reply lands
+_reply_cond = threading.Condition()
+_reply_waiters: dict[str, int] = {}  # msg_id -> number of waiting requests
+_reply_recipients: dict[str, str] = {}  # msg_id -> its sender, who gets the reply
+_replies: dict[str, dict] = {}  # msg_id -> reply, once it arrives
+
 
 # ── Database ──────────────────────────────────────────────────────────────────
 
@@ -93,7 +100,7 @@ def next_seq(conn) -> int:
 
 def insert_message(msg: dict) -> None:
     conn = get_db()
-    seq = next_seq(conn)
+    seq = msg["seq"] = int(next_seq(conn))
     conn.execute(
         "INSERT INTO messages (id, seq, ts, from_c, to_c, msg_type, payload) "
         "VALUES (?,?,?,?,?,?,?)",
@@ -143,6 +150,39 @@ def _fanout(msg: dict, to_client: str):
                         pass
 
 
+def _wake_reply_waiters(msg: dict):
+    """Hand msg to any long-poll request waiting for a reply to it."""
+    payload = msg["payload"]
+    if not isinstance(payload, dict):
+        return
+    with _reply_cond:
+        woke = False
+        for key in (payload.get("reply_to"), payload.get("request_id")):
+            if (
+                key in _reply_waiters
+                and key not in _replies
+                and msg["to"] in ("all", _reply_recipients.get(key, msg["to"]))
+            ):
+                _replies[key] = msg
+                woke = True
+        if woke:
+            _reply_cond.notify_all()
+
+
+def find_reply(msg_id: str, after_seq: int, recipient: str) -> dict | None:
+    """First reply to msg_id stored after it (seq > after_seq) for recipient."""
+    conn = get_db()
+    # Unary + keeps SQLite on idx_seq (a range over rows since the request)
+    # rather than idx_to_c, which covers the recipient's whole history
+    rows = conn.execute(
+        "SELECT * FROM messages WHERE seq > ? AND +to_c IN (?,?) "
+        "AND (json_extract(payload, '$.reply_to') = ? "
+        "OR json_extract(payload, '$.request_id') = ?) ORDER BY seq LIMIT 1",
+        (after_seq, recipient, "all", msg_id, msg_id),
+    ).fetchall()
+    return rows_to_messages(rows)[0] if rows else None
+
+
 def _register(client_id: str) -> queue.Queue:
     q = queue.Queue(maxsize=200)
     with _subscribers_lock:
@@ -180,29 +220,87 @@ def send_message():
     msg = make_message(data)
     insert_message(msg)
     _fanout(msg, msg["to"])
+    _wake_reply_waiters(msg)
     return jsonify({"status": "ok", "message_id": msg["id"], "seq": msg.get("seq")})
 
 
 @app.route("/api/messages", methods=["GET"])
 def get_messages():
-    """Polling fallback — returns messages newer than `since` timestamp."""
-    since = request.args.get("since", "")
+    """
+    Polling fallback — returns messages newer than `since` timestamp,
+    or after sequence number `after_seq` when given.
+    """
+    after_seq = request.args.get("after_seq")
     to_filter = request.args.get("to", "all")
 
-    conn = get_db()
-    if to_filter == "all":
-        rows = conn.execute(
-            "SELECT * FROM messages WHERE ts > ? ORDER BY seq", (since,)
-        ).fetchall()
+    if after_seq is not None:
+        try:
+            after_seq = int(after_seq)
+        except ValueError:
+            return jsonify({"error": "after_seq must be an integer"}), 400
+        where, args = "seq > ?", [after_seq]
     else:
-        rows = conn.execute(
-            "SELECT * FROM messages WHERE ts > ? AND to_c IN (?,?) ORDER BY seq",
-            (since, to_filter, "all"),
-        ).fetchall()
+        where, args = "ts > ?", [request.args.get("since", "")]
+    if to_filter != "all":
+        where += " AND to_c IN (?,?)"
+        args += [to_filter, "all"]
+
+    conn = get_db()
+    rows = conn.execute(
+        f"SELECT * FROM messages WHERE {where} ORDER BY seq", args
+    ).fetchall()
 
     return jsonify({"messages": rows_to_messages(rows)})
 
 
+@app.route("/api/messages/wait", methods=["GET"])
+def wait_for_reply():
+    """
+    Long-poll — blocks until a message replying to `reply_to` arrives,
+    or `timeout` seconds pass (message is null then).
+    """
+    msg_id = request.args.get("reply_to", "")
+    if not msg_id:
+        return jsonify({"error": "reply_to parameter required"}), 400
+
+    try:
+        timeout = float(request.args.get("timeout", 25))
+    except ValueError:
+        timeout = math.nan
+    if math.isnan(timeout):
+        return jsonify({"error": "timeout must be a number"}), 400
+    timeout = min(max(timeout, 0.0), 60.0)
+
+    conn = get_db()
+    original = conn.execute(
+        "SELECT seq, from_c FROM messages WHERE id = ?", (msg_id,)
+    ).fetchone()
+
+    # Register before checking the DB so a reply sent in between isn't missed
+    with _reply_cond:
+        _reply_waiters[msg_id] = _reply_waiters.get(msg_id, 0) + 1
+        if original:
+            _reply_recipients[msg_id] = original["from_c"]
+    try:
+        reply = None
+        if original:
+            # Only rows after the request can reply to it — no full-history scan
+            reply = find_reply(msg_id, original["seq"], original["from_c"])
+        if reply is None:
+            with _reply_cond:
+                _reply_cond.wait_for(lambda: msg_id in _replies, timeout)
+                reply = _replies.get(msg_id)
+    finally:
+        with _reply_cond:
+            _reply_waiters[msg_id] -= 1
+            if not _reply_waiters[msg_id]:
+                del _reply_waiters[msg_id]
+                _reply_recipients.pop(msg_id, None)
+                _replies.pop(msg_id, None)
+
+    return jsonify({"message": reply})
+
+
 @app.route("/api/subscribe")
 def subscribe():
     """
@@ -309,5 +407,6 @@ if __name__ == "__main__":
     print("📤 Send:         POST /api/send")
     print("🔍 Search (FTS): GET  /api/search?q=<query>")
     print("📋 Poll:         GET  /api/messages")
+    print("⏳ Await reply:  GET  /api/messages/wait?reply_to=<id>")
     print("💾 Persistence:  SQLite  bridge_messages.db")
     app.run(host="0.0.0.0", port=5001, debug=False, threaded=True)
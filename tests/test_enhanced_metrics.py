@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Enhanced Metrics
+
+Run with: pytest tests/test_enhanced_metrics.py -v
+"""
+from decimal import Decimal
+
+import pytest
+
+import enhanced_metrics
+from enhanced_metrics import Counter, Histogram, MetricsCollector, Summary
+
+
+class TestHistogram:
+    """Test histogram bucketing"""
+
+    def test_bucket_boundaries(self):
+        """Test values land in the first bucket >= value"""
+        hist = Histogram(buckets=[100, 10, 50])
+
+        for value in [5, 10, 11, 50, 75, 100, 101]:
+            hist.observe(value)
+
+        stats = hist.get_stats()
+        assert stats["count"] == 7
+        assert stats["sum"] == 352
+        assert stats["buckets"] == {10: 2, 50: 2, 100: 2, float("inf"): 1}
+
+    def test_empty(self):
+        """Test empty histogram stats"""
+        hist = Histogram(buckets=[1, 2, 3])
+
+        assert hist.get_stats() == {"count": 0, "sum": 0, "avg": 0, "buckets": {}}
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_observe_many_matches_observe(self, monkeypatch, use_numpy):
+        """Test batch observations bucket like individual ones"""
+        if use_numpy and not enhanced_metrics.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(enhanced_metrics, "NUMPY_AVAILABLE", use_numpy)
+
+        values = [0, 1, 5, 10, 10.5, 50, 99, 100, 250]
+        single = Histogram(buckets=[1, 10, 100])
+        batch = Histogram(buckets=[1, 10, 100])
+
+        for value in values:
+            single.observe(value)
+        batch.observe_many(values)
+
+        assert batch.get_stats() == single.get_stats()
+
+
+class TestCounter:
+    """Test labeled counters"""
+
+    def test_label_order_independent(self):
+        """Test label dicts map to one key regardless of order"""
+        counter = Counter("messages_sent")
+        counter.inc(labels={"from": "code", "to": "browser"})
+        counter.inc(labels={"to": "browser", "from": "code"}, amount=2)
+
+        assert counter.get(labels={"from": "code", "to": "browser"}) == 3
+        assert counter.get_all() == {"from=code,to=browser": 3}
+
+    def test_equal_label_values_of_different_types(self):
+        """Test 1, 1.0 and True label values stay separate series"""
+        counter = Counter("requests")
+        for value in (1, True, 1.0):
+            counter.inc(labels={"a": value, "b": "x"})
+
+        assert counter.get_all() == {"a=1,b=x": 1, "a=True,b=x": 1, "a=1.0,b=x": 1}
+
+    def test_inc_key(self):
+        """Test precomputed-key fast path shares storage with inc"""
+        counter = Counter("messages_sent")
+        counter.inc(labels={"to": "browser"})
+        counter.inc_key("to=browser", 4)
+
+        assert counter.get(labels={"to": "browser"}) == 5
+
+    def test_unlabeled_and_bound_increments(self):
+        """Test unlabeled fast path and bind() share storage with inc"""
+        counter = Counter("requests")
+        counter.inc()
+        counter.bind()(2)
+        counter.inc_key("", 3)
+        inc_browser = counter.bind({"to": "browser"})
+        inc_browser()
+        inc_browser(4)
+
+        assert counter.get() == 6
+        assert counter.get(labels={"to": "browser"}) == 5
+        assert counter.get_all() == {"": 6, "to=browser": 5}
+
+
+class TestSummary:
+    """Test summary quantiles and expiry"""
+
+    def test_quantiles(self):
+        """Test quantiles pick the expected order statistics"""
+        summary = Summary("latency")
+        for value in range(100, 0, -1):
+            summary.observe(value)
+
+        stats = summary.get_stats(quantiles=[0, 0.5, 0.9, 1.0])
+        assert stats["count"] == 100
+        assert stats["sum"] == 5050
+        assert stats["avg"] == 50.5
+        assert stats["min"] == 1
+        assert stats["max"] == 100
+        assert stats["quantiles"] == {0: 1, 0.5: 51, 0.9: 91, 1.0: 100}
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_large_window_quantiles(self, monkeypatch, use_numpy):
+        """Test numpy selection and sorted() give identical quantiles"""
+        if use_numpy and not enhanced_metrics.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(enhanced_metrics, "NUMPY_AVAILABLE", use_numpy)
+
+        summary = Summary("latency")
+        for value in range(1000):
+            summary.observe((value * 7919) % 1000)
+
+        stats = summary.get_stats(quantiles=[0.5, 0.99, 1.0])
+        assert stats["min"] == 0
+        assert stats["max"] == 999
+        assert stats["quantiles"] == {0.5: 500, 0.99: 990, 1.0: 999}
+
+    def test_old_observations_expire(self, monkeypatch):
+        """Test observations older than max_age are dropped"""
+        clock = [1000.0]
+        monkeypatch.setattr(enhanced_metrics.time, "time", lambda: clock[0])
+
+        summary = Summary("latency", max_age=10)
+        summary.observe(1)
+        summary.observe(2)
+        clock[0] += 11
+        summary.observe(3)
+
+        stats = summary.get_stats()
+        assert stats["count"] == 1
+        assert stats["sum"] == 3
+        assert summary.count == 3
+
+
+class TestMetricsCollector:
+    """Test collector export and snapshots"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.metrics = MetricsCollector()
+
+    def test_prometheus_export(self):
+        """Test Prometheus text output for every metric type"""
+        counter = self.metrics.counter("messages_sent", "Total messages sent")
+        counter.inc(labels={"to": "browser"})
+        counter.inc()
+        self.metrics.gauge("connections", "Open connections").set(3)
+        hist = self.metrics.histogram("size", buckets=[10, 100])
+        hist.observe(5)
+        hist.observe(500)
+        self.metrics.summary("latency").observe(7)
+
+        assert self.metrics.get_prometheus_metrics().split("\n") == [
+            "# HELP messages_sent Total messages sent",
+            "# TYPE messages_sent counter",
+            "messages_sent{to=browser} 1",
+            "messages_sent 1",
+            "# HELP connections Open connections",
+            "# TYPE connections gauge",
+            "connections 3",
+            "# HELP size Histogram",
+            "# TYPE size histogram",
+            'size_bucket{le="10"} 1',
+            'size_bucket{le="+In"} 1',
+            "size_sum 505",
+            "size_count 2",
+            "# HELP latency Summary",
+            "# TYPE latency summary",
+            'latency{quantile="0.5"} 7.0',
+            'latency{quantile="0.9"} 7.0',
+            'latency{quantile="0.95"} 7.0',
+            'latency{quantile="0.99"} 7.0',
+            "latency_sum 7.0",
+            "latency_count 1",
+        ]
+
+    def test_snapshots_share_unchanged_metrics(self):
+        """Test unchanged metrics reuse the previous snapshot's data"""
+        counter = self.metrics.counter("messages_sent")
+        gauge = self.metrics.gauge("connections")
+        counter.inc()
+        gauge.set(1)
+
+        first = self.metrics.take_snapshot()
+        gauge.set(2)
+        second = self.metrics.take_snapshot()
+
+        assert second["counters"]["messages_sent"] is first["counters"]["messages_sent"]
+        assert first["gauges"]["connections"] == {"": 1}
+        assert second["gauges"]["connections"] == {"": 2}
+        assert second["counters"] is first["counters"]
+
+        self.metrics.summary("latency").observe(5)
+        third = self.metrics.take_snapshot()
+        assert third["gauges"] is second["gauges"]
+        assert third["summaries"]["latency"]["count"] == 1
+        assert second["summaries"] == {}
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_time_series_window(self, monkeypatch, compact):
+        """Test get_time_series only returns snapshots inside the window"""
+        clock = [1_000_000.0]
+        monkeypatch.setattr(enhanced_metrics.time, "time", lambda: clock[0])
+        self.metrics = MetricsCollector(compact_snapshots=compact)
+        counter = self.metrics.counter("messages_sent")
+
+        for _ in range(5):
+            counter.inc()
+            self.metrics.take_snapshot()
+            clock[0] += 60
+
+        series = self.metrics.get_time_series("messages_sent", "counter", 3)
+        assert [point["value"] for point in series] == [{"": 3}, {"": 4}, {"": 5}]
+
+    def test_prometheus_export_tracks_changes(self):
+        """Test cached export sections refresh after metrics change"""
+        counter = self.metrics.counter("messages_sent")
+        hist = self.metrics.histogram("size", buckets=[10])
+        counter.inc()
+        hist.observe(1)
+        first = self.metrics.get_prometheus_bytes()
+
+        assert self.metrics.get_prometheus_bytes() == first
+
+        counter.inc(labels={"to": "browser"})
+        hist.observe(20)
+        second = self.metrics.get_prometheus_metrics()
+
+        assert "messages_sent{to=browser} 1" in second
+        assert 'size_bucket{le="+In"} 1' in second
+        assert "size_count 2" in second
+
+    def test_prometheus_export_non_float_values(self):
+        """Test values like Decimal and numpy scalars export as plain numbers"""
+        np = pytest.importorskip("numpy")
+        self.metrics.gauge("d").set(Decimal("2.5"))
+        self.metrics.gauge("g").set(np.float64(1.5))
+        hist = self.metrics.histogram("hh", buckets=[10])
+        hist.observe(np.float64(1.5))
+
+        exported = self.metrics.get_prometheus_metrics().split("\n")
+
+        assert "d 2.5" in exported
+        assert "g 1.5" in exported
+        assert "hh_sum 1.5" in exported
+
+    def test_compact_snapshots_round_trip(self):
+        """Test compact snapshots decode to the original data"""
+        self.metrics = MetricsCollector(compact_snapshots=True)
+        hist = self.metrics.histogram("size", buckets=[10])
+        hist.observe(5)
+        hist.observe(50)
+
+        snapshot = self.metrics.take_snapshot()
+        series = self.metrics.get_time_series("size", "histogram")
+
+        assert isinstance(self.metrics.snapshots[-1], bytes)
+        assert series == [
+            {
+                "timestamp": snapshot["timestamp"],
+                "value": snapshot["histograms"]["size"],
+            }
+        ]
+        assert series[0]["value"]["buckets"] == {10: 1, float("inf"): 1}
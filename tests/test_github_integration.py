@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+"""
+Unit tests for GitHub Integration
+
+Run with: pytest tests/test_github_integration.py -v
+"""
+import dataclasses
+import io
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import github_integration
+from github_integration import CollabRoomGitHub, GitHubIntegration
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, data=None, status_code=200, headers=None):
+        self._data = data
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = headers or {}
+        self.text = str(data)
+
+    def json(self):
+        return self._data
+
+
+class FakeSession:
+    """Records requests and replays queued responses"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, json=None, params=None, timeout=None):
+        self.calls.append((method, url, json, params))
+        return self.responses.pop(0)
+
+
+class RoutingSession:
+    """Answers by URL so concurrent callers get deterministic responses"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def request(self, method, url, json=None, params=None, timeout=None):
+        with self.lock:
+            self.calls.append((method, url, json, params))
+        return self.handler(method, url, json)
+
+
+def make_issue(number, state="open", **extra):
+    """Build a REST API issue object"""
+    issue = {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": None,
+        "state": state,
+        "user": {"login": "claude-code"},
+        "labels": [{"name": "bug"}],
+        "assignees": [{"login": "claude-web"}],
+        "html_url": f"https://github.com/owner/repo/issues/{number}",
+    }
+    issue.update(extra)
+    return issue
+
+
+class TestGitHubRestClient:
+    """Test the token-authenticated REST path"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.github = GitHubIntegration("owner/repo", token="secret")
+
+    def test_session_headers(self):
+        """Test the shared session carries auth and API headers"""
+        headers = self.github._session.headers
+
+        assert headers["Authorization"] == "Bearer secret"
+        assert headers["Accept"] == "application/vnd.github+json"
+
+    def test_connection_pool(self):
+        """Test API requests share one sized keep-alive pool"""
+        adapter = self.github._session.get_adapter("https://api.github.com/repos")
+
+        assert adapter._pool_maxsize == github_integration.HTTP_POOL_SIZE
+
+    def test_context_manager_closes_session(self):
+        """Test leaving the with-block closes the session"""
+        closed = []
+        self.github._session.close = lambda: closed.append(True)
+
+        with self.github as github:
+            assert github is self.github
+
+        assert closed == [True]
+
+    def test_create_issue(self):
+        """Test create_issue posts to the issues endpoint"""
+        self.github._session = FakeSession(
+            [FakeResponse({"number": 7, "html_url": "https://x/7"})]
+        )
+
+        issue = self.github.create_issue(
+            "Title", "Body", "claude-code", labels=["bug"], assignees=["me"]
+        )
+
+        method, url, payload, _ = self.github._session.calls[0]
+        assert method == "POST"
+        assert url == "https://api.github.com/repos/owner/repo/issues"
+        assert payload["labels"] == ["bug"]
+        assert payload["body"].endswith("👤 Created by: claude-code")
+        assert issue.number == 7
+        assert issue.url == "https://x/7"
+
+    def test_body_passed_through_without_footer(self):
+        """Test bodies go out untouched when there is nothing to append"""
+        self.github._session = FakeSession(
+            [FakeResponse({"number": 8, "html_url": "https://x/8"}), FakeResponse({})]
+        )
+        body = "Plain body"
+
+        issue = self.github.create_issue("Title", body, created_by="")
+        self.github.add_issue_comment(8, author="", comment="LGTM")
+
+        assert issue.body is body
+        assert self.github._session.calls[1][2] == {"body": "LGTM"}
+
+    def test_list_open_issues_skips_pull_requests(self):
+        """Test the issues listing drops PR entries and normalizes state"""
+        self.github._session = FakeSession(
+            [FakeResponse([make_issue(1), make_issue(2, pull_request={})])]
+        )
+
+        issues = self.github.list_open_issues(labels=["bug", "ui"])
+
+        _, _, _, params = self.github._session.calls[0]
+        assert params["labels"] == "bug,ui"
+        assert [issue.number for issue in issues] == [1]
+        assert issues[0].state == "OPEN"
+        assert issues[0].body == ""
+        assert issues[0].labels == ("bug",)
+
+    def test_review_event(self):
+        """Test reviews send APPROVE / REQUEST_CHANGES events"""
+        self.github._session = FakeSession([FakeResponse({}), FakeResponse({})])
+
+        assert self.github.add_pr_review(3, "claude-web", approve=True)
+        assert self.github.add_pr_review(3, "claude-web", approve=False)
+
+        assert self.github._session.calls[0][2] == {"event": "APPROVE"}
+        assert self.github._session.calls[1][2] == {"event": "REQUEST_CHANGES"}
+
+    def test_rate_limit_pause(self, monkeypatch):
+        """Test an exhausted rate limit sleeps until the reset time"""
+        sleeps = []
+        monkeypatch.setattr(github_integration.time, "time", lambda: 1000.0)
+        monkeypatch.setattr(github_integration.time, "sleep", sleeps.append)
+        exhausted = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1005"}
+        self.github._session = FakeSession(
+            [
+                FakeResponse(make_issue(1), headers=exhausted),
+                FakeResponse(make_issue(2)),
+            ]
+        )
+
+        self.github.get_issue(1)
+        assert sleeps == []
+
+        self.github.get_issue(2)
+        assert sleeps == [5.0]
+
+    def test_get_missing_issue(self):
+        """Test a failed lookup returns None"""
+        self.github._session = FakeSession([FakeResponse({}, status_code=404)])
+
+        assert self.github.get_issue(99) is None
+
+
+class TestBatchFetch:
+    """Test concurrent GitHub calls"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.github = GitHubIntegration("owner/repo", token="secret")
+
+    def test_get_issues_keeps_order(self):
+        """Test batched lookups return results in request order"""
+
+        def handler(method, url, payload):
+            number = int(url.rsplit("/", 1)[1])
+            if number == 3:
+                return FakeResponse({}, status_code=404)
+            return FakeResponse(make_issue(number))
+
+        self.github._session = RoutingSession(handler)
+
+        issues = self.github.get_issues([5, 3, 1, 8, 2, 9, 4])
+
+        assert [i.number if i else None for i in issues] == [5, None, 1, 8, 2, 9, 4]
+        assert len(self.github._session.calls) == 7
+
+    def test_failed_call_yields_none(self, caplog, capsys):
+        """Test an exception in one call doesn't sink the batch and is logged"""
+
+        def boom(number):
+            raise RuntimeError("network down")
+
+        results = self.github.batch_fetch([(boom, 1), (lambda n: n * 2, 21)])
+
+        assert results == [None, 42]
+        assert capsys.readouterr().out == ""
+        assert caplog.records[0].message == "GitHub call boom(1,) failed"
+        assert caplog.records[0].exc_info[1].args == ("network down",)
+
+    def test_decisions_to_issues(self):
+        """Test decisions are created concurrently and announced"""
+        messages = []
+        room = SimpleNamespace(
+            room_id="room-1",
+            decisions=[
+                SimpleNamespace(id="d1", text="Use Redis", proposed_by="claude-code"),
+                SimpleNamespace(id="d2", text="Add tests", proposed_by="claude-web"),
+            ],
+            send_message=lambda sender, text: messages.append(text),
+        )
+
+        def handler(method, url, payload):
+            number = 10 if "Redis" in payload["title"] else 11
+            return FakeResponse({"number": number, "html_url": f"https://x/{number}"})
+
+        self.github._session = RoutingSession(handler)
+        room_github = CollabRoomGitHub(room, self.github)
+
+        results = room_github.decisions_to_issues(["d1", "missing", "d2"])
+
+        assert results["d1"].number == 10
+        assert results["d2"].number == 11
+        assert results["missing"] is None
+        assert room_github.issue_map == {"d1": 10, "d2": 11}
+        assert len(messages) == 2
+
+
+class TestReadCache:
+    """Test the TTL/LRU cache around read calls"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.github = GitHubIntegration("owner/repo", token="secret")
+        self.github._session = RoutingSession(self.handle)
+
+    def handle(self, method, url, payload):
+        """Serve issues by number and accept every mutation"""
+        if method == "GET" and url.endswith("/issues"):
+            return FakeResponse([make_issue(1), make_issue(2)])
+        if method == "GET":
+            return FakeResponse(make_issue(int(url.rsplit("/", 1)[1])))
+        return FakeResponse({})
+
+    def gets(self):
+        """Count GET requests sent so far"""
+        return sum(1 for call in self.github._session.calls if call[0] == "GET")
+
+    def test_repeat_reads_hit_cache(self):
+        """Test repeated reads within the TTL make one request"""
+        first = self.github.get_issue(1)
+        second = self.github.get_issue(1)
+        self.github.list_open_issues()
+        self.github.list_open_issues().clear()
+
+        assert second is first
+        assert len(self.github.list_open_issues()) == 2
+        assert self.gets() == 2
+
+    def test_ttl_expiry(self, monkeypatch):
+        """Test entries are refetched once their TTL passes"""
+        clock = [100.0]
+        monkeypatch.setattr(github_integration.time, "monotonic", lambda: clock[0])
+
+        self.github.get_issue(1)
+        clock[0] += github_integration.CACHE_TTLS["get_issue"] + 1
+        self.github.get_issue(1)
+
+        assert self.gets() == 2
+
+    def test_mutation_invalidates(self):
+        """Test close_issue drops that issue and the open-issue listing"""
+        self.github.get_issue(1)
+        self.github.get_issue(2)
+        self.github.list_open_issues()
+
+        self.github.close_issue(1)
+        self.github.get_issue(1)
+        self.github.get_issue(2)
+        self.github.list_open_issues()
+
+        assert self.gets() == 5
+
+    def test_keyword_calls_share_entries(self):
+        """Test keyword and positional calls hit and invalidate one entry"""
+        first = self.github.get_issue(issue_number=1)
+        assert self.github.get_issue(1) is first
+
+        self.github.close_issue(1)
+        self.github.get_issue(issue_number=1)
+        self.github.close_issue(issue_number=1)
+        self.github.get_issue(1)
+
+        assert self.gets() == 3
+
+    def test_lru_eviction(self, monkeypatch):
+        """Test the least recently used entry is evicted at capacity"""
+        monkeypatch.setattr(github_integration, "CACHE_MAXSIZE", 2)
+
+        self.github.get_issue(1)
+        self.github.get_issue(2)
+        self.github.get_issue(1)
+        self.github.get_issue(3)
+
+        assert [key[1] for key in self.github._cache] == [1, 3]
+
+
+class TestTokenDiscovery:
+    """Test where the REST token comes from"""
+
+    def setup_method(self):
+        """Forget any gh auth state cached by earlier tests"""
+        GitHubIntegration._gh_checked = False
+        GitHubIntegration._gh_token_loaded = False
+        GitHubIntegration._gh_token = None
+
+    teardown_method = setup_method
+
+    def test_borrows_gh_token(self, monkeypatch):
+        """Test gh's stored token is read once and used for the session"""
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd[1:])
+            return SimpleNamespace(returncode=0, stdout="gho_abc\n", stderr="")
+
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.setattr(github_integration.subprocess, "run", fake_run)
+
+        github = GitHubIntegration("owner/repo")
+
+        assert calls == [["auth", "token"]]
+        assert github._session.headers["Authorization"] == "Bearer gho_abc"
+
+    def test_env_token_skips_gh(self, monkeypatch):
+        """Test an environment token never spawns gh"""
+        monkeypatch.setenv("GH_TOKEN", "env-token")
+        monkeypatch.setattr(github_integration.subprocess, "run", None)
+
+        github = GitHubIntegration("owner/repo")
+
+        assert github.token == "env-token"
+
+    def test_gh_lookups_memoized(self, monkeypatch):
+        """Test gh is consulted once per process, not per instance"""
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd[1:])
+            returncode = 1 if cmd[-1] == "token" else 0
+            return SimpleNamespace(returncode=returncode, stdout="", stderr="")
+
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.setattr(github_integration.subprocess, "run", fake_run)
+
+        first = GitHubIntegration("owner/repo")
+        second = GitHubIntegration("owner/other")
+
+        assert first._session is None and second._session is None
+        assert calls == [["auth", "token"], ["auth", "status"]]
+
+
+class TestRoomLookups:
+    """Test CollabRoomGitHub decision/task indexes"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.room = SimpleNamespace(room_id="room-1", decisions=[], tasks=[])
+        self.room_github = CollabRoomGitHub(
+            self.room, GitHubIntegration("owner/repo", token="secret")
+        )
+
+    def test_index_picks_up_appended_items(self):
+        """Test items added after the first lookup are still found"""
+        first = SimpleNamespace(id="d1")
+        self.room.decisions.append(first)
+        assert self.room_github._find_decision("d1") is first
+
+        second = SimpleNamespace(id="d2")
+        self.room.decisions.append(second)
+        assert self.room_github._find_decision("d2") is second
+        assert self.room_github._find_decision("missing") is None
+
+    def test_task_lookup(self):
+        """Test tasks are indexed by their id key"""
+        task = {"id": "t1", "text": "Write docs"}
+        self.room.tasks.append(task)
+
+        assert self.room_github._find_task("t1") is task
+        assert self.room_github._find_task("t2") is None
+
+
+class FakePopen:
+    """Stand-in for a gh process printing one JSON object per line"""
+
+    def __init__(self, lines):
+        self.lines = lines
+        self.cmd = None
+
+    def __call__(self, cmd, **kwargs):
+        self.cmd = cmd
+        self.stdout = io.StringIO("".join(line + "\n" for line in self.lines))
+        return self
+
+    def wait(self, timeout=None):
+        return 0
+
+
+class TestGhListing:
+    """Test the gh CLI listing path"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.github = GitHubIntegration("owner/repo", token="unused")
+        self.github._session = None
+
+    def test_iter_open_issues_streams_lines(self, monkeypatch):
+        """Test gh output is parsed one JSON line at a time"""
+        item = {
+            "number": 4,
+            "title": "Flaky test",
+            "body": "",
+            "state": "OPEN",
+            "labels": [{"name": "ci"}],
+            "assignees": [],
+            "url": "https://github.com/owner/repo/issues/4",
+        }
+        popen = FakePopen([json.dumps(item), json.dumps({**item, "number": 5})])
+        monkeypatch.setattr(github_integration.subprocess, "Popen", popen)
+
+        issues = self.github.iter_open_issues(labels=["ci"])
+        first = next(issues)
+
+        assert popen.cmd[-2:] == ["--jq", ".[]"]
+        assert "--label" in popen.cmd
+        assert first.number == 4
+        assert first.labels == ("ci",)
+        assert [issue.number for issue in issues] == [5]
+
+    def test_failed_listing_is_empty(self, monkeypatch):
+        """Test a gh failure (no output) yields an empty list"""
+        monkeypatch.setattr(github_integration.subprocess, "Popen", FakePopen([]))
+
+        assert self.github.list_open_prs() == []
+
+    def test_fields_projection(self, monkeypatch):
+        """Test fields narrows the gh --json request and blanks the rest"""
+        popen = FakePopen(['{"number":9,"url":"https://x/9"}'])
+        monkeypatch.setattr(github_integration.subprocess, "Popen", popen)
+
+        (pr,) = self.github.list_open_prs(fields=("number", "url"))
+
+        assert popen.cmd[popen.cmd.index("--json") + 1] == "number,url"
+        assert (pr.number, pr.url) == (9, "https://x/9")
+        assert pr.title == pr.source_branch == ""
+
+    def test_results_are_immutable(self, monkeypatch):
+        """Test shared (cacheable) issue objects can't be modified"""
+        popen = FakePopen(['{"number":9,"labels":[{"name":"ci"}]}'])
+        monkeypatch.setattr(github_integration.subprocess, "Popen", popen)
+
+        (issue,) = self.github.list_open_issues()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            issue.state = "CLOSED"
+        assert not hasattr(issue, "__dict__")
+
+
+class TestGhRun:
+    """Test how gh subprocesses are launched"""
+
+    def test_spawn_friendly_arguments(self, monkeypatch):
+        """Test gh runs by absolute path without closing inherited fds"""
+        seen = {}
+
+        def fake_run(cmd, **kwargs):
+            seen.update(kwargs, cmd=cmd)
+            return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+        monkeypatch.setattr(github_integration, "_gh_executable", lambda: "/bin/gh")
+        monkeypatch.setattr(github_integration.subprocess, "run", fake_run)
+
+        github_integration._gh_run(["gh", "pr", "list"], timeout=5)
+
+        assert seen["cmd"] == ["/bin/gh", "pr", "list"]
+        assert seen["close_fds"] is False
+        assert seen["timeout"] == 5
+        assert "process_group" not in seen
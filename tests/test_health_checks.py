@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Health Checks
+
+Run with: pytest tests/test_health_checks.py -v
+"""
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+pytest.importorskip("psutil")
+
+import health_checks  # noqa: E402
+from health_checks import HealthCheck, HealthCheckManager  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestRunChecks:
+    """Test health check execution"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.health = HealthCheckManager()
+
+    def test_checks_run_concurrently(self):
+        """Test slow checks overlap instead of running back to back"""
+        barrier = threading.Barrier(3, timeout=2)
+
+        def slow_check():
+            barrier.wait()
+            return True, "ok"
+
+        checks = [
+            HealthCheck(name=f"slow_{i}", check_func=slow_check) for i in range(3)
+        ]
+
+        results = self.health._run_checks(checks)
+
+        assert results["passed"] == 3
+        assert all(r["message"] == "ok" for r in results["checks"].values())
+
+    def test_timeout_fails_check(self):
+        """Test a check exceeding its timeout is reported as failed"""
+        release = threading.Event()
+
+        def hung_check():
+            release.wait(5)
+            return True, "late"
+
+        checks = [
+            HealthCheck(name="hung", check_func=hung_check, timeout=0.05),
+            HealthCheck(name="fast", check_func=lambda: (True, "ok")),
+        ]
+
+        started = time.time()
+        results = self.health._run_checks(checks)
+        release.set()
+
+        assert time.time() - started < 1
+        assert results["checks"]["hung"]["passed"] is False
+        assert "timed out" in results["checks"]["hung"]["message"]
+        assert results["checks"]["fast"]["passed"] is True
+
+    def test_exceptions_and_disabled_checks(self):
+        """Test raising checks fail and disabled checks are skipped"""
+
+        def broken_check():
+            raise RuntimeError("boom")
+
+        checks = [
+            HealthCheck(name="broken", check_func=broken_check, critical=False),
+            HealthCheck(name="off", check_func=broken_check, enabled=False),
+        ]
+
+        results = self.health._run_checks(checks)
+
+        assert list(results["checks"]) == ["broken"]
+        assert results["checks"]["broken"]["message"] == "Check failed: boom"
+        assert results["checks"]["broken"]["critical"] is False
+
+
+class TestResourceReadings:
+    """Test cached psutil readings in the built-in checks"""
+
+    def test_psutil_loaded_lazily(self):
+        """Test psutil is only imported once a resource check runs"""
+        code = (
+            "import sys, health_checks; "
+            "health_checks.HealthCheckManager(); "
+            "print('psutil' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, cwd=ROOT
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_probes_reuse_readings(self, monkeypatch):
+        """Test liveness probes share one non-blocking psutil reading per TTL"""
+        clock = [100.0]
+        cpu_calls = []
+        monkeypatch.setattr(health_checks.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(
+            health_checks._get_psutil(),
+            "cpu_percent",
+            lambda interval: cpu_calls.append(interval) or 12.5,
+        )
+        health = HealthCheckManager()
+
+        first = health.check_liveness()
+        health.check_liveness()
+        clock[0] += health_checks.RESOURCE_CACHE_TTL
+        health.check_liveness()
+
+        assert cpu_calls == [None, None]
+        assert first["checks"]["system_resources"]["message"].startswith("CPU: 12.5%")
+
+
+class TestProbeRoutes:
+    """Test the Flask probe endpoints"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.app = Flask(__name__)
+        self.health = HealthCheckManager(self.app)
+        self.client = self.app.test_client()
+        self.calls = 0
+
+        def counted_check():
+            self.calls += 1
+            return True, "ok"
+
+        self.health.add_readiness_check(
+            HealthCheck(name="counted", check_func=counted_check)
+        )
+
+    def test_ready_response(self):
+        """Test readiness returns JSON with the check results"""
+        response = self.client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/json"
+        assert response.get_json()["checks"]["counted"]["passed"] is True
+
+    def test_probe_response_cached(self, monkeypatch):
+        """Test probes reuse the serialized response within the TTL"""
+        clock = [100.0]
+        monkeypatch.setattr(health_checks.time, "monotonic", lambda: clock[0])
+
+        first = self.client.get("/health/ready").data
+        second = self.client.get("/health/ready").data
+        clock[0] += health_checks.PROBE_CACHE_TTL
+        self.client.get("/health/ready")
+
+        assert second == first
+        assert self.calls == 2
+
+    def test_not_ready_status_code(self):
+        """Test a failing critical readiness check returns 503"""
+        self.health.add_readiness_check(
+            HealthCheck(name="down", check_func=lambda: (False, "down"))
+        )
+
+        response = self.client.get("/health/ready")
+        status = self.client.get("/health/status").get_json()
+
+        assert response.status_code == 503
+        assert status["status"] == "degraded"
+
+
+class TestProbeStatus:
+    """Test probe status from critical / non-critical failures"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.health = HealthCheckManager()
+        self.health.liveness_checks.clear()
+
+    def test_non_critical_failure_stays_healthy(self):
+        """Test only critical failures flip liveness to unhealthy"""
+        self.health.add_liveness_check(
+            HealthCheck(name="warn", check_func=lambda: (False, "x"), critical=False)
+        )
+        assert self.health.check_liveness()["status"] == "healthy"
+
+        self.health.add_liveness_check(
+            HealthCheck(name="fatal", check_func=lambda: (False, "x"))
+        )
+        assert self.health.check_liveness()["status"] == "unhealthy"
+
+    def test_counts(self):
+        """Test passed / failed counts and the critical flag"""
+        checks = [
+            HealthCheck(name="ok", check_func=lambda: (True, "ok")),
+            HealthCheck(name="warn", check_func=lambda: (False, "x"), critical=False),
+        ]
+
+        results = self.health._run_checks(checks)
+
+        assert (results["passed"], results["failed"]) == (1, 1)
+        assert results["any_critical_failed"] is False
+
+    def test_status_runs_shared_checks_once(self):
+        """Test /health/status runs a check registered for both probes once"""
+        calls = []
+
+        def database_check():
+            calls.append("database")
+            return True, "ok"
+
+        check = HealthCheck(name="database", check_func=database_check)
+        self.health.add_liveness_check(check)
+        self.health.add_readiness_check(check)
+
+        status, status_code = self.health._status_result()
+
+        assert calls == ["database"]
+        assert status_code == 200
+        assert status["liveness"]["checks"]["database"]["passed"] is True
+        assert status["readiness"]["checks"]["database"]["passed"] is True
+
+
+class TestTimestamp:
+    """Test the cached probe timestamp"""
+
+    def test_formatted_once_per_second(self, monkeypatch):
+        """Test the timestamp string is reused within a second"""
+        clock = [1_700_000_000.2]
+        monkeypatch.setattr(health_checks.time, "time", lambda: clock[0])
+
+        first = health_checks._utc_timestamp()
+        clock[0] += 0.5
+        second = health_checks._utc_timestamp()
+        clock[0] += 1
+        third = health_checks._utc_timestamp()
+
+        assert first == "2023-11-14T22:13:20+00:00"
+        assert second is first
+        assert third == "2023-11-14T22:13:21+00:00"
+
+
+class TestWsgiMount:
+    """Test serving probes from the bare WSGI app"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.app = Flask(__name__)
+        self.health = HealthCheckManager(self.app)
+        self.health.liveness_checks.clear()
+        self.health.mount_wsgi(self.app)
+        self.client = self.app.test_client()
+
+        @self.app.before_request
+        def reject_everything():
+            return "flask handled this", 418
+
+    def test_probes_bypass_flask(self):
+        """Test /health/* is answered without reaching Flask"""
+        live = self.client.get("/health/live")
+        other = self.client.get("/messages")
+
+        assert live.status_code == 200
+        assert live.get_json()["status"] == "healthy"
+        assert live.headers["Content-Length"] == str(len(live.data))
+        assert other.status_code == 418
+
+    def test_failing_probe_and_unknown_path(self):
+        """Test status codes for failing probes, unknown paths and methods"""
+        self.health.add_readiness_check(
+            HealthCheck(name="down", check_func=lambda: (False, "down"))
+        )
+
+        assert self.client.get("/health/ready").status_code == 503
+        assert self.client.get("/health/startup").status_code == 503
+        assert self.client.get("/health/nope").status_code == 404
+        assert self.client.post("/health/live").status_code == 405
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Kanban Board
+
+Run with: pytest tests/test_kanban_board.py -v
+"""
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from kanban_board import KanbanBoard, KanbanTask, TaskPriority, TaskStatus
+
+
+class TestDependencies:
+    """Test dependency tracking and blocked tasks"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.board = KanbanBoard("board-1", "Test Board")
+        self.setup = self.board.create_task("Setup", "", created_by="claude-code")
+        self.build = self.board.create_task("Build", "", created_by="claude-code")
+        self.test = self.board.create_task("Test", "", created_by="claude-code")
+        self.board.add_dependency(self.build, self.setup)
+        self.board.add_dependency(self.test, self.build)
+        self.board.add_dependency(self.test, self.setup)
+
+    def blocked_ids(self):
+        """IDs of currently blocked tasks"""
+        return {task.id for task in self.board.get_blocked_tasks()}
+
+    def test_blocked_until_dependencies_done(self):
+        """Test tasks unblock only once every dependency is DONE"""
+        assert self.blocked_ids() == {self.build, self.test}
+
+        self.board.move_task(self.setup, TaskStatus.DONE)
+        assert self.blocked_ids() == {self.test}
+
+        self.board.move_task(self.build, TaskStatus.IN_PROGRESS)
+        self.board.move_task(self.build, TaskStatus.DONE)
+        assert self.blocked_ids() == set()
+        assert self.board._can_start_task(self.test)
+
+    def test_blocked_task_cannot_start(self):
+        """Test moving a blocked task to IN_PROGRESS raises"""
+        with pytest.raises(Exception, match="blocked by dependencies"):
+            self.board.move_task(self.build, TaskStatus.IN_PROGRESS)
+
+    def test_reopening_blocks_dependents_again(self):
+        """Test moving a dependency out of DONE re-blocks its dependents"""
+        self.board.move_task(self.setup, TaskStatus.DONE)
+        self.board.move_task(self.setup, TaskStatus.REVIEW)
+
+        assert self.blocked_ids() == {self.build, self.test}
+
+    def test_dependency_on_done_or_missing_task(self):
+        """Test done dependencies don't block and missing ones do"""
+        self.board.move_task(self.setup, TaskStatus.DONE)
+        docs = self.board.create_task("Docs", "", created_by="claude-code")
+
+        self.board.add_dependency(docs, self.setup)
+        self.board.add_dependency(docs, self.setup)
+        assert self.board._can_start_task(docs)
+
+        self.board.add_dependency(docs, "missing")
+        assert not self.board._can_start_task(docs)
+
+    def test_cycles_rejected(self):
+        """Test dependencies that would form a cycle are refused"""
+        assert self.board.add_dependency(self.setup, self.test) is False
+        assert self.board.add_dependency(self.setup, self.setup) is False
+        assert self.board.add_dependency(self.test, self.setup) is True
+
+        assert self.board.get_task(self.setup).dependencies == set()
+        assert self.board._can_start_task(self.setup)
+
+    def test_execution_order(self):
+        """Test every task comes after the unfinished tasks it depends on"""
+        docs = self.board.create_task("Docs", "", created_by="claude-code")
+        orphan = self.board.create_task("Orphan", "", created_by="claude-code")
+        self.board.add_dependency(orphan, "missing")
+
+        order = [task.id for task in self.board.get_execution_order()]
+
+        assert order == [self.setup, docs, self.build, self.test]
+
+    def test_execution_order_with_done_dependency(self):
+        """Test done dependencies don't hold their dependents back"""
+        self.board.move_task(self.setup, TaskStatus.DONE)
+
+        order = [task.id for task in self.board.get_execution_order()]
+
+        assert order == [self.setup, self.build, self.test]
+
+
+class TestColumns:
+    """Test column membership as tasks move"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.board = KanbanBoard("board-1", "Test Board")
+
+    def test_move_keeps_column_order(self):
+        """Test tasks leave their old column and join the new one in order"""
+        first = self.board.create_task("First", "", created_by="claude-code")
+        second = self.board.create_task("Second", "", created_by="claude-code")
+
+        self.board.move_task(second, TaskStatus.IN_PROGRESS)
+        self.board.move_task(first, TaskStatus.IN_PROGRESS)
+
+        assert self.board.get_tasks_by_status(TaskStatus.TODO) == []
+        in_progress = self.board.get_tasks_by_status(TaskStatus.IN_PROGRESS)
+        assert [task.id for task in in_progress] == [second, first]
+
+    def test_archive(self):
+        """Test archived tasks get their own column and status count"""
+        task_id = self.board.create_task("Old", "", created_by="claude-code")
+
+        self.board.move_task(task_id, TaskStatus.ARCHIVED)
+
+        assert self.board.get_tasks_by_status(TaskStatus.ARCHIVED)[0].id == task_id
+        assert self.board.get_analytics()["by_status"]["archived"] == 1
+
+
+class TestExport:
+    """Test board export"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.board = KanbanBoard("board-1", "Test Board")
+        self.first = self.board.create_task("First", "", created_by="claude-code")
+        self.second = self.board.create_task("Second", "", created_by="claude-code")
+
+    def test_export_reuses_untouched_tasks(self):
+        """Test only tasks changed since the last export are re-serialized"""
+        self.board.export_board()
+        before = dict(self.board._task_cache)
+
+        self.board.add_time(self.second, 15)
+        after = self.board.export_board()["tasks"]
+
+        assert self.board._task_cache[self.first] is before[self.first]
+        assert self.board._task_cache[self.second] is not before[self.second]
+        assert after[1]["time_spent_minutes"] == 15
+        assert after[1]["status"] == "todo"
+
+    def test_mutating_export_leaves_later_exports_alone(self):
+        """Test changes to an exported task don't leak into the next export"""
+        self.board.add_comment(self.first, "claude-code", "hello")
+        exported = self.board.export_board()["tasks"][0]
+
+        exported["title"] = "MUTATED"
+        exported["tags"].append("x")
+        exported["comments"][0]["text"] = "changed"
+
+        again = self.board.export_board()["tasks"][0]
+        assert again["title"] == "First"
+        assert again["tags"] == []
+        assert again["comments"][0]["text"] == "hello"
+        assert json.loads(self.board.export_board_bytes())["tasks"][0] == again
+
+    def test_export_covers_every_field(self):
+        """Test exported tasks carry every KanbanTask field in JSON-ready form"""
+        self.board.add_comment(self.first, "claude-code", "hello")
+
+        exported = self.board.export_board()["tasks"][0]
+
+        assert set(exported) == set(KanbanTask.__dataclass_fields__)
+        assert exported["comments"][0]["text"] == "hello"
+        assert exported["tags"] == []
+        json.dumps(exported)
+
+    def test_export_bytes(self):
+        """Test the byte export decodes to the same board as export_board"""
+        self.board.move_task(self.first, TaskStatus.DONE)
+
+        exported = json.loads(self.board.export_board_bytes())
+
+        assert exported == json.loads(json.dumps(self.board.export_board()))
+        assert exported["tasks"][0]["status"] == "done"
+
+
+class TestAnalytics:
+    """Test board analytics"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.board = KanbanBoard("board-1", "Test Board")
+
+    def test_counts(self):
+        """Test status / priority / assignee counts and time totals"""
+        first = self.board.create_task(
+            "First", "", created_by="claude-code", assignee="claude-desktop-1"
+        )
+        second = self.board.create_task(
+            "Second",
+            "",
+            created_by="claude-code",
+            priority=TaskPriority.HIGH,
+            assignee="claude-desktop-1",
+        )
+        self.board.create_task("Third", "", created_by="claude-code")
+        self.board.move_task(first, TaskStatus.DONE)
+        self.board.add_time(first, 30)
+        self.board.add_time(second, 15)
+
+        analytics = self.board.get_analytics()
+
+        assert analytics["by_status"]["todo"] == 2
+        assert analytics["by_status"]["done"] == 1
+        assert analytics["by_status"]["archived"] == 0
+        assert analytics["by_priority"] == {
+            "low": 0,
+            "medium": 2,
+            "high": 1,
+            "urgent": 0,
+        }
+        assert analytics["by_assignee"] == {"claude-desktop-1": 2}
+        assert analytics["total_time_spent"] == 45
+        assert analytics["avg_time_per_task"] == 15
+        assert analytics["completion_rate"] == pytest.approx(100 / 3)
+
+
+class TestTimestamps:
+    """Test task timestamps"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.board = KanbanBoard("board-1", "Test Board")
+
+    def test_move_stamps_comment_and_task_alike(self):
+        """Test a move uses one timestamp for updated_at and its comment"""
+        task_id = self.board.create_task("Task", "", created_by="claude-code")
+        task = self.board.get_task(task_id)
+
+        self.board.move_task(task_id, TaskStatus.IN_PROGRESS, "claude-desktop-1")
+
+        assert task.comments[-1].timestamp == task.updated_at.isoformat()
+        assert task.comments[-1].author == "claude-desktop-1"
+        assert task.comments[-1].id == "c1"
+        assert task.created_at <= task.updated_at
+
+    def test_import_bulk(self):
+        """Test bulk import creates every task with one creation time"""
+        task_ids = self.board.import_bulk(
+            [
+                {"title": "First", "description": "", "created_by": "jira"},
+                {
+                    "title": "Second",
+                    "description": "",
+                    "created_by": "jira",
+                    "priority": TaskPriority.HIGH,
+                },
+            ]
+        )
+
+        first, second = (self.board.get_task(task_id) for task_id in task_ids)
+        assert (first.title, second.title) == ("First", "Second")
+        assert second.priority == TaskPriority.HIGH
+        assert first.created_at == second.created_at == first.updated_at
+
+
+class TestAssignees:
+    """Test tasks-by-assignee lookups"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.board = KanbanBoard("board-1", "Test Board")
+
+    def assigned_ids(self, assignee):
+        """IDs of the tasks assigned to assignee"""
+        return [task.id for task in self.board.get_tasks_by_assignee(assignee)]
+
+    def test_reassignment_moves_task(self):
+        """Test reassigning a task moves it between assignees"""
+        first = self.board.create_task(
+            "First", "", created_by="claude-code", assignee="claude-desktop-1"
+        )
+        second = self.board.create_task("Second", "", created_by="claude-code")
+
+        self.board.assign_task(second, "claude-desktop-1")
+        self.board.assign_task(first, "claude-desktop-2")
+
+        assert self.assigned_ids("claude-desktop-1") == [second]
+        assert self.assigned_ids("claude-desktop-2") == [first]
+        assert self.assigned_ids("nobody") == []
+        assert self.board.get_analytics()["by_assignee"] == {
+            "claude-desktop-1": 1,
+            "claude-desktop-2": 1,
+        }
+
+
+class TestOverdue:
+    """Test overdue task tracking"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.board = KanbanBoard("board-1", "Test Board")
+        now = datetime.now(timezone.utc)
+        self.late = self.board.create_task(
+            "Late", "", created_by="claude-code", due_date=now - timedelta(days=1)
+        )
+        self.later = self.board.create_task(
+            "Later", "", created_by="claude-code", due_date=now - timedelta(days=2)
+        )
+        self.future = self.board.create_task(
+            "Future", "", created_by="claude-code", due_date=now + timedelta(days=1)
+        )
+        self.board.create_task("Undated", "", created_by="claude-code")
+
+    def overdue_ids(self):
+        """IDs of currently overdue tasks"""
+        return [task.id for task in self.board.get_overdue_tasks()]
+
+    def test_overdue_by_due_date(self):
+        """Test only past-due tasks are reported, oldest first, on every call"""
+        assert self.overdue_ids() == [self.later, self.late]
+        assert self.overdue_ids() == [self.later, self.late]
+
+    def test_done_and_reopened(self):
+        """Test finishing a task clears it and reopening brings it back"""
+        self.board.move_task(self.late, TaskStatus.DONE)
+        assert self.overdue_ids() == [self.later]
+
+        self.board.move_task(self.late, TaskStatus.REVIEW)
+        assert self.overdue_ids() == [self.later, self.late]
+
+
+class TestReadyStream:
+    """Test streaming tasks as they become ready"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.board = KanbanBoard("board-1", "Test Board")
+        self.setup = self.board.create_task("Setup", "", created_by="claude-code")
+        self.build = self.board.create_task("Build", "", created_by="claude-code")
+        self.board.add_dependency(self.build, self.setup)
+
+    def test_tasks_stream_as_dependencies_finish(self):
+        """Test ready tasks are yielded first, then unblocked and new ones"""
+
+        async def consume():
+            stream = self.board.ready_stream()
+            seen = [(await anext(stream)).id]
+
+            self.board.move_task(self.setup, TaskStatus.IN_PROGRESS)
+            self.board.move_task(self.setup, TaskStatus.DONE)
+            seen.append((await anext(stream)).id)
+
+            docs = self.board.create_task("Docs", "", created_by="claude-code")
+            seen.append((await anext(stream)).id)
+            return seen, docs
+
+        seen, docs = asyncio.run(consume())
+
+        assert seen == [self.setup, self.build, docs]
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Load Balancer
+
+Run with: pytest tests/test_load_balancer.py -v
+"""
+import pytest
+
+from load_balancer import LoadBalancer, LoadStrategy
+
+
+class TestMetricStrategies:
+    """Test least-loaded and fastest-response selection"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.lb = LoadBalancer(strategy=LoadStrategy.LEAST_LOADED)
+        for client_id in ("a", "b", "c"):
+            self.lb.register_client(client_id)
+
+    def test_least_loaded(self):
+        """Test the client with fewest pending messages is picked"""
+        self.lb.increment_pending("a")
+        self.lb.increment_pending("a")
+        self.lb.increment_pending("b")
+        self.lb.increment_pending("c")
+        self.lb.increment_pending("c")
+        self.lb.decrement_pending("c")
+        self.lb.decrement_pending("c")
+
+        assert self.lb.select_client() == "c"
+        assert self.lb.select_client(excluded=["c"]) == "b"
+
+        self.lb.mark_unhealthy("b")
+        self.lb.unregister_client("c")
+        assert self.lb.select_client() == "a"
+
+    def test_excluded_clients_left_in_heap(self):
+        """Test unhealthy clients leave the heap and exclusions don't touch it"""
+        self.lb.increment_pending("a")
+        self.lb.increment_pending("b")
+        self.lb.increment_pending("b")
+
+        self.lb.mark_unhealthy("c")
+        self.lb.increment_pending("c")
+        assert "c" not in self.lb._load_heap._latest
+        assert self.lb.select_client() == "a"
+        heap = list(self.lb._load_heap._heap)
+
+        assert self.lb.select_client(excluded=["a"]) == "b"
+        assert self.lb._load_heap._heap == heap
+
+        self.lb.mark_healthy("c")
+        self.lb.increment_pending("a")
+        assert self.lb.select_client() == "c"
+        assert self.lb.select_client(excluded=["c"]) == "b"
+
+    def test_fastest_response(self):
+        """Test the client with the lowest average latency is picked"""
+        self.lb.change_strategy(LoadStrategy.FASTEST_RESPONSE)
+        self.lb.record_latency("a", 50)
+        self.lb.record_latency("b", 10)
+        self.lb.record_latency("c", 30)
+
+        assert self.lb.select_client() == "b"
+
+        self.lb.record_latency("b", 100)
+        assert self.lb.select_client() == "c"
+
+    def test_batched_latencies_match_single(self):
+        """Test record_latencies gives the same averages as record_latency"""
+        samples = [("a", 40), ("b", 20), ("a", 10), ("x", 5), ("b", 80), ("a", 25)]
+        single = LoadBalancer(strategy=LoadStrategy.FASTEST_RESPONSE)
+        for client_id in ("a", "b", "c"):
+            single.register_client(client_id)
+        for client_id, latency_ms in samples:
+            single.record_latency(client_id, latency_ms)
+
+        self.lb.change_strategy(LoadStrategy.FASTEST_RESPONSE)
+        self.lb.record_latencies(samples)
+
+        for client_id in ("a", "b", "c"):
+            batched = self.lb.get_client_stats(client_id)
+            expected = single.get_client_stats(client_id)
+            assert batched["avg_latency_ms"] == pytest.approx(
+                expected["avg_latency_ms"]
+            )
+            assert batched["last_latency_ms"] == expected["last_latency_ms"]
+        assert self.lb.select_client() == single.select_client() == "c"
+
+    def test_many_updates(self):
+        """Test selection stays correct after many superseded updates"""
+        for _ in range(100):
+            for client_id in ("a", "b", "c"):
+                self.lb.increment_pending(client_id)
+        self.lb.decrement_pending("b")
+
+        assert self.lb.select_client() == "b"
+        assert len(self.lb._load_heap._heap) < 40
+
+
+class TestHealthyClients:
+    """Test healthy-client tracking"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.lb = LoadBalancer(strategy=LoadStrategy.ROUND_ROBIN)
+        for client_id in ("a", "b", "c"):
+            self.lb.register_client(client_id)
+
+    def test_round_robin_skips_unhealthy(self):
+        """Test round-robin cycles through healthy clients only"""
+        self.lb.mark_unhealthy("b")
+
+        picks = [self.lb.select_client() for _ in range(4)]
+
+        assert picks == ["a", "c", "a", "c"]
+        assert self.lb.get_healthy_clients() == ["a", "c"]
+
+        self.lb.mark_healthy("b")
+        assert self.lb.get_healthy_clients() == ["a", "c", "b"]
+        assert self.lb.get_stats()["healthy_clients"] == 3
+
+    def test_excluded_and_none_available(self):
+        """Test excluded clients are skipped and None returned when none remain"""
+        assert self.lb.select_client(excluded=["a", "b"]) == "c"
+
+        self.lb.unregister_client("c")
+        assert self.lb.select_client(excluded=["a", "b"]) is None
+
+
+class TestWeighted:
+    """Test weighted random selection"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.lb = LoadBalancer(strategy=LoadStrategy.WEIGHTED)
+        self.lb.register_client("light", weight=1.0)
+        self.lb.register_client("heavy", weight=3.0)
+
+    def test_distribution_follows_weights(self, monkeypatch):
+        """Test each client gets the share of the range its weight covers"""
+        picks = []
+        for value in (0.0, 0.24, 0.25, 0.99):
+            monkeypatch.setattr(self.lb._rng, "random", lambda: value)
+            picks.append(self.lb.select_client())
+
+        assert picks == ["light", "light", "heavy", "heavy"]
+
+    def test_seeded_balancers_agree(self):
+        """Test balancers with the same seed make the same random picks"""
+        picks = []
+        for _ in range(2):
+            lb = LoadBalancer(strategy=LoadStrategy.RANDOM, seed=7)
+            for client_id in ("a", "b", "c"):
+                lb.register_client(client_id)
+            picks.append([lb.select_client() for _ in range(10)])
+
+        assert picks[0] == picks[1]
+
+    def test_weights_follow_health_changes(self, monkeypatch):
+        """Test cached weights are rebuilt after a client goes unhealthy"""
+        monkeypatch.setattr(self.lb._rng, "random", lambda: 0.0)
+        assert self.lb.select_client() == "light"
+
+        self.lb.mark_unhealthy("light")
+        assert self.lb.select_client() == "heavy"
+        assert self.lb.select_client(excluded=["heavy"]) is None
+
+
+class TestStickySessions:
+    """Test consistent-hash sticky sessions"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.lb = LoadBalancer(strategy=LoadStrategy.STICKY_SESSION)
+        for client_id in ("a", "b", "c", "d"):
+            self.lb.register_client(client_id)
+        self.sessions = [f"session-{i}" for i in range(200)]
+
+    def assignments(self):
+        """Client chosen for each session"""
+        return {s: self.lb.select_client(session_id=s) for s in self.sessions}
+
+    def test_sessions_stick(self):
+        """Test a session keeps its client and sessions spread over clients"""
+        first = self.assignments()
+
+        assert self.assignments() == first
+        assert set(first.values()) == {"a", "b", "c", "d"}
+
+    def test_ring_follows_membership_lazily(self):
+        """Test the ring is only rebuilt by a sticky lookup after joins/leaves"""
+        first = self.assignments()
+        self.lb.unregister_client("d")
+        self.lb.register_client("e")
+
+        assert self.lb._ring_dirty
+        after = self.assignments()
+
+        assert not self.lb._ring_dirty
+        assert set(self.lb._ring_clients) == {"a", "b", "c", "e"}
+        kept = [s for s in self.sessions if first[s] != "d" and after[s] != "e"]
+        assert kept and all(after[s] == first[s] for s in kept)
+
+    def test_failover_only_moves_failed_sessions(self):
+        """Test only the failed client's sessions move, and come back after"""
+        before = self.assignments()
+        moved = [s for s, client in before.items() if client == "b"]
+
+        assert self.lb.failover("b", session_id=moved[0]) != "b"
+        after = self.assignments()
+
+        assert all(after[s] == before[s] for s in self.sessions if s not in moved)
+        assert all(after[s] != "b" for s in moved)
+
+        self.lb.mark_healthy("b")
+        assert self.assignments() == before
+
+
+class TestStats:
+    """Test aggregate statistics"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.lb = LoadBalancer()
+        for client_id in ("a", "b"):
+            self.lb.register_client(client_id)
+
+    def test_last_used(self):
+        """Test last_used is empty until a result is recorded"""
+        assert self.lb.get_client_stats("a")["last_used"] is None
+
+        self.lb.record_success("a")
+
+        assert self.lb.get_client_stats("a")["last_used"].endswith("+00:00")
+
+    def test_running_totals(self):
+        """Test pending and success-rate totals follow updates and removals"""
+        self.lb.increment_pending("a")
+        self.lb.increment_pending("a")
+        self.lb.increment_pending("b")
+        self.lb.decrement_pending("b")
+        self.lb.decrement_pending("b")
+        self.lb.record_failure("b")
+        self.lb.record_success("a")
+
+        stats = self.lb.get_stats()
+        rates = [self.lb.clients[c].success_rate for c in ("a", "b")]
+        assert stats["total_pending"] == 2
+        assert stats["avg_success_rate"] == pytest.approx(sum(rates) / 2)
+
+        self.lb.unregister_client("a")
+        stats = self.lb.get_stats()
+        assert stats["total_pending"] == 0
+        assert stats["avg_success_rate"] == pytest.approx(rates[1])
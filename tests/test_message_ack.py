@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Message Acknowledgment System
+
+Run with: pytest tests/test_message_ack.py -v
+"""
+import threading
+import time
+
+import message_ack
+from message_ack import AckManager, MessageStatus
+
+
+class TestTimeouts:
+    """Test timeout detection and cleanup of old messages"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.clock = [1000.0]
+        self.ack_mgr = AckManager()
+        self.timed_out = []
+        self.ack_mgr.register_callback("on_timeout", self.timed_out.append)
+
+    def test_timeout_after_deadline(self, monkeypatch):
+        """Test only unacknowledged messages past their timeout time out"""
+        monkeypatch.setattr(message_ack.time, "monotonic", lambda: self.clock[0])
+        slow = self.ack_mgr.send_message("code", "browser", "command", {}, timeout=5)
+        acked = self.ack_mgr.send_message("code", "desktop", "command", {}, timeout=5)
+        self.ack_mgr.mark_acknowledged(acked)
+
+        self.clock[0] += 5
+        self.ack_mgr._check_timeouts()
+        assert self.timed_out == []
+
+        self.clock[0] += 0.1
+        self.ack_mgr._check_timeouts()
+        assert [msg.id for msg in self.timed_out] == [slow]
+        assert self.ack_mgr.get_message(slow).status is MessageStatus.TIMEOUT
+        assert self.ack_mgr.get_stats()["total_timeout"] == 1
+
+    def test_cleanup_old(self, monkeypatch):
+        """Test cleanup removes only finished messages older than max age"""
+        monkeypatch.setattr(message_ack.time, "monotonic", lambda: self.clock[0])
+        old = self.ack_mgr.send_message("code", "browser", "command", {})
+        pending = self.ack_mgr.send_message("code", "browser", "command", {})
+        self.ack_mgr.mark_acknowledged(old)
+
+        self.clock[0] += 60
+        recent = self.ack_mgr.send_message("code", "browser", "command", {})
+        self.ack_mgr.mark_acknowledged(recent)
+
+        assert self.ack_mgr.cleanup_old(max_age_seconds=30) == 1
+        assert self.ack_mgr.get_message(old) is None
+        assert self.ack_mgr.get_message(pending) is not None
+        assert self.ack_mgr.get_message(recent) is not None
+
+
+class TestRetryWorker:
+    """Test the background timeout worker"""
+
+    def setup_method(self):
+        """Setup test fixture"""
+        self.ack_mgr = AckManager(retry_delay=5)
+        self.fired = threading.Event()
+        self.ack_mgr.register_callback("on_timeout", lambda msg: self.fired.set())
+
+    def teardown_method(self):
+        """Stop the worker"""
+        self.ack_mgr.stop_retry_worker()
+
+    def test_wakes_for_deadline_sent_while_sleeping(self):
+        """Test a new send's deadline fires without waiting out retry_delay"""
+        self.ack_mgr.start_retry_worker()
+        time.sleep(0.05)
+
+        started = time.monotonic()
+        msg_id = self.ack_mgr.send_message("code", "browser", "cmd", {}, timeout=0.1)
+
+        assert self.fired.wait(2)
+        assert time.monotonic() - started < 1
+        assert self.ack_mgr.get_message(msg_id).status is MessageStatus.TIMEOUT